@@ -0,0 +1,86 @@
+# Carga y simula charts sinteticos de distintos tamanos y reporta tiempo de
+# carga (JSON y cache binario), memoria pico y costo por frame de update().
+# Uso: python -m benchmarks.bench_chart_scaling [--sizes 1000 10000 100000] [--frames 1200]
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+import pygame
+from scripts_week.song import Song
+from scripts_week.chart_cache import get_cache_path
+from .chart_generator import write_chart
+from .headless_sim import HeadlessWeek, build_scripted_inputs
+
+def timed_load(path, use_cache):
+    tracemalloc.start()
+    start = time.perf_counter()
+    song = Song.from_json_file(path, use_cache=use_cache)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return song, elapsed, peak
+
+def measure(screen, note_count, frames, directory, options):
+    path = os.path.join(directory, f"stress_{note_count}.json")
+    write_chart(path, notes=note_count, **options)
+
+    _, json_time, json_peak = timed_load(path, use_cache=False)
+    Song.from_json_file(path)  # escribe el cache
+    song, cache_time, cache_peak = timed_load(path, use_cache=True)
+
+    week = HeadlessWeek(screen, song, build_scripted_inputs(song, jitter=0.03, seed=1))
+    week.run(max_frames=frames)
+
+    update_times = sorted(week.update_times)
+    mean = sum(update_times) / len(update_times)
+    p99 = update_times[min(len(update_times) - 1, int(len(update_times) * 0.99))]
+
+    os.remove(path)
+    if os.path.exists(get_cache_path(path)):
+        os.remove(get_cache_path(path))
+
+    return {
+        "notes": len(song.chart),
+        "json_ms": json_time * 1000,
+        "cache_ms": cache_time * 1000,
+        "json_peak_mb": json_peak / 2**20,
+        "cache_peak_mb": cache_peak / 2**20,
+        "update_mean_us": mean * 1e6,
+        "update_p99_us": p99 * 1e6
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de escala de charts")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1000, 10000, 100000, 300000])
+    parser.add_argument("--frames", type=int, default=1200)
+    parser.add_argument("--density", type=float, default=4.0)
+    parser.add_argument("--chord-size", type=int, default=1)
+    parser.add_argument("--sustain-ratio", type=float, default=0.2)
+    parser.add_argument("--pattern", default="mixed")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    options = {
+        "density": args.density,
+        "chord_size": args.chord_size,
+        "sustain_ratio": args.sustain_ratio,
+        "pattern": args.pattern,
+        "bpm_changes": [180, 120, 200],
+        "bpm_change_every": 8
+    }
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            results.append(measure(screen, size, args.frames, directory, options))
+
+    print(f"{'notas':>8} {'json ms':>9} {'cache ms':>9} {'json MB':>8} {'cache MB':>9} "
+          f"{'update us':>10} {'p99 us':>8}")
+    for r in results:
+        print(f"{r['notes']:>8} {r['json_ms']:>9.1f} {r['cache_ms']:>9.1f} {r['json_peak_mb']:>8.1f} "
+              f"{r['cache_peak_mb']:>9.1f} {r['update_mean_us']:>10.1f} {r['update_p99_us']:>8.1f}")
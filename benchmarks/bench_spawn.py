@@ -0,0 +1,40 @@
+# Mide el costo por frame de Song.get_notes_for_spawning segun el largo del chart.
+# Uso: python -m benchmarks.bench_spawn
+import time
+from scripts_week.song import Song
+
+NOTES_PER_SECOND = 8
+FRAME_TIME = 1 / 60
+MEASURED_FRAMES = 600
+
+def build_notes_data(note_count, bpm=150):
+    section_length_ms = 4 * 60000 / bpm
+    sections = []
+    for i in range(note_count):
+        time_ms = 1000 + i * 1000 / NOTES_PER_SECOND
+        section_index = int(time_ms // section_length_ms)
+        while len(sections) <= section_index:
+            sections.append({"mustHitSection": len(sections) % 2 == 0, "sectionNotes": []})
+        sections[section_index]["sectionNotes"].append([time_ms, i % 4, 0])
+    return sections
+
+def measure(note_count):
+    song = Song("bench", 150, build_notes_data(note_count))
+    song.start()
+
+    # Frames a mitad de la cancion, donde el escaneo lineal era mas caro
+    song.seek(song.duration / 2)
+    spawned = 0
+    start = time.perf_counter()
+    for _ in range(MEASURED_FRAMES):
+        song.current_time += FRAME_TIME
+        spawned += len(song.get_notes_for_spawning())
+    elapsed = time.perf_counter() - start
+
+    return elapsed / MEASURED_FRAMES * 1e6, spawned
+
+if __name__ == "__main__":
+    print(f"{'notas':>8} {'us/frame':>10} {'spawneadas':>11}")
+    for note_count in (100, 1000, 10000, 50000):
+        per_frame, spawned = measure(note_count)
+        print(f"{note_count:>8} {per_frame:>10.2f} {spawned:>11}")
@@ -0,0 +1,55 @@
+# Mide el costo de AudioManager.play_sound a lo largo de una sesion simulada
+# de varias horas (muchas mas llamadas que voces) y el tamaño de la tabla de voces.
+# Uso: python -m benchmarks.bench_voice_pool [--hours 3] [--sounds-per-second 12]
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import time
+from array import array
+import pygame
+from scripts.audio_manager import AudioManager
+from scripts.mixer_service import mixer_service, PRIORITY_LOW, PRIORITY_HIGH
+
+BUCKETS = 10
+
+def build_sound(milliseconds=400):
+    frequency, _, channels = pygame.mixer.get_init()
+    samples = array('h', [0]) * int(frequency * milliseconds / 1000) * channels
+    return pygame.mixer.Sound(buffer=samples.tobytes())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Microbenchmark del pool de voces")
+    parser.add_argument("--hours", type=float, default=3.0)
+    parser.add_argument("--sounds-per-second", type=float, default=12.0)
+    args = parser.parse_args()
+
+    audio = AudioManager()
+    audio.loaded_sounds["hit"] = build_sound()
+    audio.loaded_sounds["scroll"] = build_sound()
+
+    calls = int(args.hours * 3600 * args.sounds_per_second)
+    bucket_size = max(1, calls // BUCKETS)
+    ids = set()
+    failed = 0
+
+    print(f"{calls} llamadas, {len(mixer_service.voice_pool)} voces")
+    print(f"{'tramo':>6} {'us/llamada':>11} {'voces activas':>14} {'robos':>7}")
+    for bucket in range(BUCKETS):
+        start = time.perf_counter()
+        for i in range(bucket_size):
+            if i % 3:
+                voice_id = audio.play_sound("hit", volume=0.7, priority=PRIORITY_HIGH)
+            else:
+                voice_id = audio.play_sound("scroll", volume=0.5, priority=PRIORITY_LOW)
+            if voice_id is None:
+                failed += 1
+            else:
+                ids.add(voice_id)
+        elapsed = time.perf_counter() - start
+        print(f"{bucket + 1:>6} {elapsed / bucket_size * 1e6:>11.2f} "
+              f"{len(mixer_service.voice_pool.get_active_voices()):>14} {mixer_service.voice_pool.steal_count:>7}")
+
+    print(f"Ids unicos: {len(ids)} de {calls - failed} reproducciones (sin voz: {failed})")
+    audio.stop_all_sounds()
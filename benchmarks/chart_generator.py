@@ -0,0 +1,148 @@
+# Genera charts sinteticos en formato FNF para pruebas de escala.
+# Uso: python -m benchmarks.chart_generator salida.json --notes 100000 --density 4 --pattern mixed
+import argparse
+import json
+import math
+import random
+
+STEPS_PER_BEAT = 4
+SECTION_STEPS = 16
+SECTION_BEATS = SECTION_STEPS // STEPS_PER_BEAT
+MAX_ROWS_PER_BEAT = 48     # 192avos: mas fino que cualquier chart real
+PATTERNS = ("stream", "jack", "mixed")
+
+def _next_direction(rng, pattern, previous, run_length):
+    if pattern == "jack" or (pattern == "mixed" and run_length < 3 and rng.random() < 0.3):
+        if previous is not None:
+            return previous
+    # stream: nunca repite carril seguido
+    choices = [direction for direction in range(4) if direction != previous]
+    return rng.choice(choices)
+
+def _chord_directions(rng, pattern, previous, run_length, chord_size):
+    lead = _next_direction(rng, pattern, previous, run_length)
+    others = [direction for direction in range(4) if direction != lead]
+    return [lead] + rng.sample(others, chord_size - 1)
+
+def get_rows_per_section(density, chord_size=1):
+    # Filas (instantes con nota) por seccion; tiene que ser entero para que
+    # la densidad pedida sea exacta y no un redondeo a la grilla de 16avos
+    if density <= 0:
+        raise ValueError(f"density tiene que ser mayor que 0: {density}")
+    if not 1 <= chord_size <= 4:
+        raise ValueError(f"chord_size tiene que estar entre 1 y 4: {chord_size}")
+
+    rows_per_beat = density / chord_size
+    rows_per_section = rows_per_beat * SECTION_BEATS
+    if rows_per_beat > MAX_ROWS_PER_BEAT:
+        raise ValueError(f"density {density} con acordes de {chord_size} pide {rows_per_beat:g} filas por beat "
+                         f"(maximo {MAX_ROWS_PER_BEAT}); usar un chord_size mayor")
+    if abs(rows_per_section - round(rows_per_section)) > 1e-9:
+        raise ValueError(f"density {density} con acordes de {chord_size} no da un numero entero de filas "
+                         f"por seccion ({rows_per_section:g}); usar un multiplo de {chord_size / SECTION_BEATS:g}")
+    return int(round(rows_per_section))
+
+def generate_chart(notes=None, sections=None, density=4.0, sustain_ratio=0.1,
+                   bpm=150, bpm_changes=(), bpm_change_every=0, chord_size=1,
+                   pattern="mixed", lead_in_sections=1, seed=0, name="Stress"):
+    """Arma un chart FNF ({"song": {...}}).
+
+    density son notas por beat (4 = semicorcheas, 8 = fusas, 3 = tresillos
+    de corchea) y se respeta exacta: las filas van a density / chord_size
+    por beat, aunque caigan entre los 16avos, y cada fila es un acorde de
+    chord_size carriles distintos. Una densidad que no da un numero entero
+    de filas por seccion es ValueError, no se redondea. Si se pasa notes,
+    la cantidad de secciones se calcula para llegar a ese numero de notas.
+    Con bpm_change_every > 0 cada tantas secciones se cambia al siguiente
+    bpm de bpm_changes (changeBPM/bpm, como los charts reales). Las
+    primeras lead_in_sections secciones quedan vacias, como una intro.
+    """
+    if pattern not in PATTERNS:
+        raise ValueError(f"Patron desconocido: {pattern}")
+
+    rng = random.Random(seed)
+    rows_per_section = get_rows_per_section(density, chord_size)
+    notes_per_section = rows_per_section * chord_size
+    if sections is None:
+        sections = lead_in_sections + math.ceil((notes or 1000) / notes_per_section)
+
+    chart_sections = []
+    current_bpm = bpm
+    section_start_ms = 0.0
+    remaining = notes if notes is not None else sections * notes_per_section
+    previous = None
+    run_length = 0
+
+    for section_index in range(sections):
+        section = {
+            "mustHitSection": section_index % 2 == 0,
+            "typeOfSection": 0,
+            "lengthInSteps": SECTION_STEPS,
+            "sectionNotes": []
+        }
+
+        if bpm_change_every and bpm_changes and section_index and section_index % bpm_change_every == 0:
+            current_bpm = bpm_changes[(section_index // bpm_change_every - 1) % len(bpm_changes)]
+            section["changeBPM"] = True
+            section["bpm"] = current_bpm
+
+        step_ms = 60000.0 / current_bpm / STEPS_PER_BEAT
+        row_ms = SECTION_STEPS * step_ms / rows_per_section
+        for row in range(rows_per_section):
+            if remaining <= 0 or section_index < lead_in_sections:
+                break
+
+            directions = _chord_directions(rng, pattern, previous, run_length, chord_size)
+            run_length = run_length + 1 if directions[0] == previous else 1
+            previous = directions[0]
+
+            row_time = round(section_start_ms + row * row_ms, 3)
+            for direction in directions[:remaining]:
+                length = 0
+                if rng.random() < sustain_ratio:
+                    length = round(row_ms * rng.randint(1, 2), 3)
+                section["sectionNotes"].append([row_time, direction, length])
+                remaining -= 1
+
+        chart_sections.append(section)
+        section_start_ms += SECTION_STEPS * step_ms
+
+    return {
+        "song": {
+            "song": name,
+            "bpm": bpm,
+            "speed": 1,
+            "needsVoices": False,
+            "player1": "bf",
+            "player2": "gf",
+            "notes": chart_sections
+        }
+    }
+
+def write_chart(path, **options):
+    chart = generate_chart(**options)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(chart, f)
+    return chart
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generador de charts de estres")
+    parser.add_argument("output")
+    parser.add_argument("--notes", type=int, default=None)
+    parser.add_argument("--sections", type=int, default=None)
+    parser.add_argument("--density", type=float, default=4.0, help="notas por beat (exacta, acepta 32avos y tresillos)")
+    parser.add_argument("--chord-size", type=int, default=1, help="notas por fila, en carriles distintos (1-4)")
+    parser.add_argument("--sustain-ratio", type=float, default=0.1)
+    parser.add_argument("--bpm", type=float, default=150)
+    parser.add_argument("--bpm-changes", type=float, nargs="*", default=[])
+    parser.add_argument("--bpm-change-every", type=int, default=0, help="secciones entre cambios de bpm")
+    parser.add_argument("--pattern", choices=PATTERNS, default="mixed")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    chart = write_chart(args.output, notes=args.notes, sections=args.sections, density=args.density,
+                        sustain_ratio=args.sustain_ratio, bpm=args.bpm, bpm_changes=args.bpm_changes,
+                        bpm_change_every=args.bpm_change_every, chord_size=args.chord_size,
+                        pattern=args.pattern, seed=args.seed)
+    note_count = sum(len(section["sectionNotes"]) for section in chart["song"]["notes"])
+    print(f"Chart generado: {args.output} ({note_count} notas, {len(chart['song']['notes'])} secciones)")
@@ -0,0 +1,133 @@
+# Comprobaciones deterministas de las herramientas de benchmarks/: replay de
+# ida y vuelta, densidad y acordes del generador de charts, y ids y robo de
+# voces del VoicePool. Falla con AssertionError ante una regresion.
+# Uso: python -m benchmarks.check_harness
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import json
+import tempfile
+from array import array
+from collections import Counter
+import pygame
+from benchmarks.chart_generator import generate_chart, SECTION_BEATS
+from benchmarks.headless_sim import run_simulation
+from scripts.mixer_service import mixer_service, VoicePool, PRIORITY_LOW, PRIORITY_NORMAL, PRIORITY_HIGH
+from scripts_week.replay import Replay
+
+RESULT_KEYS = ("score", "hit", "missed", "passed_unhit", "max_combo", "health", "judgements")
+
+def check_replay_round_trip(directory):
+    replay = Replay("Prueba")
+    for i in range(100):
+        replay.add(i * 0.125, i % 4, i % 2 == 0)
+    path = replay.save(os.path.join(directory, "prueba.fnfreplay"))
+    loaded = Replay.load(path)
+    assert loaded is not None
+    assert loaded.song_name == "Prueba"
+    assert list(loaded.times) == list(replay.times) and list(loaded.codes) == list(replay.codes)
+    assert loaded.get_event(3) == (0.375, 3, False)
+
+    garbage = os.path.join(directory, "basura.fnfreplay")
+    with open(garbage, "wb") as f:
+        f.write(b"FNFR" + bytes(40))
+    assert Replay.load(garbage) is None
+
+    # Una partida grabada y reproducida da exactamente los mismos juicios,
+    # tambien a otros fps
+    record_path = os.path.join(directory, "partida.fnfreplay")
+    recorded = run_simulation(jitter=0.08, miss_rate=0.15, seed=3, record_path=record_path)
+    for fps in (60, 144):
+        replayed = run_simulation(fps=fps, replay_path=record_path)
+        for key in RESULT_KEYS:
+            assert replayed[key] == recorded[key], (fps, key, replayed[key], recorded[key])
+
+    restarted = run_simulation(jitter=0.08, miss_rate=0.15, seed=3, restart_after=600)
+    assert not restarted["note_errors"], restarted["note_errors"][:3]
+    for key in RESULT_KEYS:
+        assert restarted[key] == recorded[key], (key, restarted[key], recorded[key])
+    print("replay: OK")
+
+def _chart_rows(chart):
+    notes = [note for section in chart["song"]["notes"] for note in section["sectionNotes"]]
+    rows = {}
+    for time_ms, direction, _ in notes:
+        rows.setdefault(time_ms, []).append(direction)
+    return notes, rows
+
+def check_chart_generator():
+    sections = 9
+    played_beats = (sections - 1) * SECTION_BEATS   # la primera seccion es la intro vacia
+    for density, chord_size in ((0.5, 1), (1, 1), (3, 1), (4, 1), (6, 1), (8, 1), (16, 1),
+                                (32, 1), (8, 2), (12, 3), (16, 4), (64, 4)):
+        chart = generate_chart(sections=sections, density=density, chord_size=chord_size, sustain_ratio=0)
+        notes, rows = _chart_rows(chart)
+        assert len(notes) == density * played_beats, (density, chord_size, len(notes))
+        assert Counter(len(lanes) for lanes in rows.values()) == {chord_size: len(rows)}, (density, chord_size)
+        assert all(len(set(lanes)) == chord_size for lanes in rows.values()), (density, chord_size)
+
+        # Filas equiespaciadas: density / chord_size por beat a 150 bpm
+        times = sorted(rows)
+        row_ms = 60000.0 / 150 / (density / chord_size)
+        assert all(abs(b - a - row_ms) < 0.002 for a, b in zip(times, times[1:])), (density, chord_size)
+
+    chart = generate_chart(notes=1001, density=8, chord_size=2)
+    assert len(_chart_rows(chart)[0]) == 1001
+
+    for density, chord_size in ((0.3, 1), (0, 1), (64, 1), (4, 5), (3, 2.5)):
+        try:
+            generate_chart(sections=2, density=density, chord_size=chord_size)
+        except (ValueError, TypeError):
+            continue
+        raise AssertionError(f"density {density} / chord_size {chord_size} deberia fallar")
+
+    # Misma semilla, mismo chart
+    assert json.dumps(generate_chart(sections=4, seed=7)) == json.dumps(generate_chart(sections=4, seed=7))
+    print("chart_generator: OK")
+
+def check_voice_pool():
+    mixer_service.init()
+    frequency, _, channels = pygame.mixer.get_init()
+    sound = pygame.mixer.Sound(buffer=(array('h', [0]) * frequency * 10 * channels).tobytes())
+
+    pool = VoicePool(1, 4)
+    ids = set()
+    voices = [pool.play(sound, priority=PRIORITY_NORMAL) for _ in range(4)]
+    ids.update(voice.id for voice in voices)
+    assert len(ids) == 4 and pool.steal_count == 0
+
+    # Todas ocupadas: una voz de menor prioridad no roba
+    assert pool.play(sound, priority=PRIORITY_LOW) is None
+
+    # A igual o mayor prioridad se roba la mas vieja y su id deja de resolver
+    oldest = voices[0].id
+    stolen = pool.play(sound, priority=PRIORITY_HIGH)
+    assert stolen is not None and pool.steal_count == 1
+    assert pool.get(oldest) is None and pool.get(stolen.id) is stolen
+    ids.add(stolen.id)
+
+    # Los loops nunca se roban
+    pool.stop_all()
+    loops = [pool.play(sound, loops=-1, priority=PRIORITY_LOW).id for _ in range(4)]
+    assert pool.play(sound, priority=PRIORITY_HIGH) is None
+    assert all(pool.get(voice_id) is not None for voice_id in loops)
+    ids.update(loops)
+    pool.stop_all()
+
+    # Los ids no se repiten aunque las voces se reciclen miles de veces
+    for _ in range(5000):
+        voice = pool.play(sound, priority=PRIORITY_HIGH)
+        assert voice.id not in ids
+        ids.add(voice.id)
+    assert len(pool.free) + len(pool.get_active_voices()) <= len(pool)
+    pool.stop_all()
+    assert len(pool.free) == len(pool)
+    print("voice_pool: OK")
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        check_replay_round_trip(directory)
+    check_chart_generator()
+    check_voice_pool()
+    print("Todas las comprobaciones pasaron")
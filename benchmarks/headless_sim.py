@@ -0,0 +1,216 @@
+# Juega un chart completo sin ventana ni audio, con reloj virtual e input
+# scripteado, y reporta notas simuladas por segundo y los juicios finales.
+# Uso: python -m benchmarks.headless_sim [chart.json] [--jitter 0.04] [--miss-rate 0.05]
+#      python -m benchmarks.headless_sim chart.json --record partida.fnfreplay
+#      python -m benchmarks.headless_sim chart.json --replay partida.fnfreplay
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import random
+import sys
+import time
+import pygame
+from scripts_week.base_week import BaseWeek
+from scripts_week.conductor import Conductor
+from scripts_week.chart_store import STATE_MISSED
+from scripts_week.song import Song
+from scripts_week.replay import Replay, ReplayRecorder
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, dt):
+        self.now += dt
+
+class NullAudioManager:
+    # Sin sonidos ni musica: el conductor queda guiado solo por el reloj virtual
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+def build_scripted_inputs(song, jitter=0.0, miss_rate=0.0, seed=0):
+    """Lista ordenada de (tiempo, direccion) que golpea las notas del jugador.
+
+    Note.update da por perdida una nota en cuanto llega su tiempo, asi que
+    las pulsaciones van siempre un poco antes (entre 1 ms y 1 ms + jitter).
+    """
+    rng = random.Random(seed)
+    chart = song.chart
+    inputs = []
+    for index in range(len(chart)):
+        if not chart.must_hit[index] or rng.random() < miss_rate:
+            continue
+        early = 0.001 + rng.random() * jitter
+        inputs.append((float(chart.time[index]) - early, int(chart.direction[index])))
+    inputs.sort()
+    return inputs
+
+class HeadlessWeek(BaseWeek):
+    def __init__(self, screen, song, inputs, fps=60):
+        super().__init__(screen)
+        self.audio_manager = NullAudioManager()
+        self.clock = VirtualClock()
+        self.conductor = Conductor(None, time_source=self.clock)
+
+        self.song = song
+        self.inputs = inputs
+        self.frame_time = 1.0 / fps
+        self.judgements = {"perfect": 0, "good": 0, "bad": 0}
+        self.frames = 0
+        self.update_times = []
+        self.note_errors = []
+
+    def on_note_hit(self, note, result):
+        self.judgements[result] += 1
+        super().on_note_hit(note, result)
+
+    def verify_notes(self):
+        # Cada nota viva es la unica instancia de su fila y es la que tiene
+        # registrada la cancion; un objeto repetido delata un reuso del pool
+        errors = []
+        seen = set()
+        for note in self.active_notes + self.confirm_notes:
+            if id(note) in seen:
+                errors.append(f"nota {note.index} repetida en active_notes")
+            seen.add(id(note))
+            if self.song.spawned_notes.get(note.index) is not note:
+                errors.append(f"nota {note.index} no es la spawneada por la cancion")
+        for direction, queue in enumerate(self.lane_queues):
+            for note in queue:
+                if note.direction != direction or (note.active and id(note) not in seen):
+                    errors.append(f"nota {note.index} invalida en el carril {direction}")
+        return errors
+
+    def run(self, max_frames=None, verify=False):
+        self.judgements = {"perfect": 0, "good": 0, "bad": 0}
+        self.restart_song()
+
+        # El conductor arranca en 0 aunque el reloj virtual ya haya corrido
+        # (reinicios), asi que el input se compara contra el tiempo de cancion
+        start_clock = self.clock.now
+        next_input = 0
+        end_time = start_clock + self.song.duration + 1.0
+        while self.game_state == "playing" and self.clock.now < end_time:
+            if max_frames is not None and self.frames >= max_frames:
+                break
+
+            self.clock.advance(self.frame_time)
+            frame_time = self.clock.now - start_clock
+
+            # Las pulsaciones se procesan con su propio tiempo, como eventos
+            # con timestamp entre dos frames
+            while next_input < len(self.inputs) and self.inputs[next_input][0] <= frame_time:
+                input_time, direction = self.inputs[next_input]
+                self.current_song_time = input_time
+                self.press_lane(direction)
+                next_input += 1
+
+            update_start = time.perf_counter()
+            self.update(self.frame_time)
+            self.update_times.append(time.perf_counter() - update_start)
+            self.frames += 1
+
+            if verify:
+                for error in self.verify_notes():
+                    self.note_errors.append(f"t={frame_time:.2f}: {error}")
+
+        return self.game_state
+
+def run_simulation(chart_path=None, jitter=0.0, miss_rate=0.0, seed=0, fps=60,
+                   replay_path=None, record_path=None, restart_after=None):
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+
+    song = Song.from_json_file(chart_path) if chart_path else Song.create_default_song()
+    replay = None
+    if replay_path:
+        try:
+            replay = Replay.load(replay_path)
+        except OSError as e:
+            raise ValueError(f"No se pudo leer el replay {replay_path}: {e.strerror}")
+        if replay is None:
+            raise ValueError(f"Replay invalido (no es un .fnfreplay o es de otra version): {replay_path}")
+
+    if replay:
+        # El replay se reproduce por BaseWeek.update(), como en tiempo real
+        week = HeadlessWeek(screen, song, [], fps)
+        week.set_replay(replay)
+    else:
+        week = HeadlessWeek(screen, song, build_scripted_inputs(song, jitter, miss_rate, seed), fps)
+    if record_path:
+        week.replay_recorder = ReplayRecorder(song.name)
+
+    start = time.perf_counter()
+    if restart_after:
+        # Reinicio a mitad de partida: la segunda corrida tiene que dar lo
+        # mismo que una limpia y sin notas compartidas entre las dos
+        week.run(restart_after, verify=True)
+        week.clock.advance(1.0)
+        final_state = week.run(verify=True)
+    else:
+        final_state = week.run()
+    elapsed = time.perf_counter() - start
+
+    if record_path:
+        week.replay_recorder.save(record_path)
+
+    passed_unhit = int((((song.chart.state & STATE_MISSED) != 0) & song.chart.must_hit).sum())
+    return {
+        "song": song.name,
+        "notes": len(song.chart),
+        "frames": week.frames,
+        "simulated_seconds": week.clock.now,
+        "wall_seconds": elapsed,
+        "notes_per_second": len(song.chart) / elapsed if elapsed > 0 else 0.0,
+        "update_mean_us": sum(week.update_times) / max(len(week.update_times), 1) * 1e6,
+        "state": final_state,
+        "score": week.score,
+        "hit": week.notes_hit,
+        "missed": week.notes_missed,
+        "passed_unhit": passed_unhit,
+        "accuracy": week.accuracy,
+        "max_combo": week.max_combo,
+        "health": week.health,
+        "judgements": week.judgements,
+        "note_errors": week.note_errors
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulacion headless de un chart")
+    parser.add_argument("chart", nargs="?", default="data/tutorial.json")
+    parser.add_argument("--jitter", type=float, default=0.0, help="adelanto aleatorio maximo de las pulsaciones (s)")
+    parser.add_argument("--miss-rate", type=float, default=0.0, help="fraccion de notas del jugador que no se pulsan")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fps", type=int, default=60)
+    parser.add_argument("--replay", default=None, help="reproduce un .fnfreplay en vez del input scripteado")
+    parser.add_argument("--record", default=None, help="guarda el input de la corrida en un .fnfreplay")
+    parser.add_argument("--restart-after", type=int, default=None,
+                        help="reinicia la cancion tras N frames y verifica las notas vivas")
+    args = parser.parse_args()
+
+    try:
+        stats = run_simulation(args.chart, args.jitter, args.miss_rate, args.seed, args.fps,
+                               args.replay, args.record, args.restart_after)
+    except ValueError as e:
+        sys.exit(f"Error: {e}")
+
+    print(f"Cancion: {stats['song']} ({stats['notes']} notas, {stats['frames']} frames, "
+          f"{stats['simulated_seconds']:.1f}s simulados)")
+    print(f"Tiempo real: {stats['wall_seconds']:.3f}s -> {stats['notes_per_second']:.0f} notas/s, "
+          f"{stats['frames'] / max(stats['wall_seconds'], 1e-9):.0f} frames/s, "
+          f"update medio {stats['update_mean_us']:.1f} us")
+    print(f"Estado final: {stats['state']} | Score: {stats['score']} | Accuracy: {stats['accuracy']:.1f}% | "
+          f"Max combo: {stats['max_combo']} | Health: {stats['health']}")
+    judgements = stats["judgements"]
+    print(f"Perfect: {judgements['perfect']} Good: {judgements['good']} Bad: {judgements['bad']} | "
+          f"Golpeadas: {stats['hit']} Fallos de input: {stats['missed']} Pasadas sin golpear: {stats['passed_unhit']}")
+    if args.restart_after:
+        errors = stats["note_errors"]
+        print(f"Reinicio tras {args.restart_after} frames: {'OK' if not errors else f'{len(errors)} errores'}")
+        for error in errors[:10]:
+            print(f"  {error}")
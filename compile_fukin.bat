@@ -25,6 +25,7 @@ pyinstaller --noconfirm --onefile --console ^
   --hidden-import "os" ^
   --hidden-import "sys" ^
   --hidden-import "psutil" ^
+  --hidden-import "numpy" ^
   --hidden-import "email" ^
   --hidden-import "email.mime" ^
   --hidden-import "email.mime.text" ^
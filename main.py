@@ -8,6 +8,11 @@ from scripts.song_selection import SongSelection
 from scripts.WeekSelectorMenu import FreeplayMenu
 from scripts.credits_menu import CreditsMenu
 from scripts.audio_manager import AudioManager
+from scripts.loading_screen import LoadingScreen
+from scripts.asset_preloader import asset_preloader
+from scripts.font_registry import font_registry
+from scripts.tween_scheduler import tween_scheduler
+from scripts.sound_index import sound_index
 
 class DebugInfo:
     def __init__(self):
@@ -20,10 +25,7 @@ class DebugInfo:
         self.fps = 0
         
     def setup_font(self):
-        try:
-            self.font = pygame.font.Font("fonts/vcr_osd_mono.ttf", 16)
-        except:
-            self.font = pygame.font.SysFont("Courier New", 16)
+        self.font = font_registry.get_font("fonts/vcr_osd_mono.ttf", 16, "Courier New")
     
     def update_fps(self):
         self.frame_count += 1
@@ -103,8 +105,9 @@ class Game:
         }
         
         self.audio_manager = AudioManager()
+        sound_index.scan()
         
-        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.ACTIVEEVENT])
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.ACTIVEEVENT])
     
     def handle_events(self):
         for event in pygame.event.get():
@@ -131,11 +134,20 @@ class Game:
     def resume_game(self):
         self.audio_manager.resume_music()
     
+    def preload_assets(self, manifest):
+        if manifest and not asset_preloader.is_ready(manifest):
+            LoadingScreen(self.screen, manifest).run()
+    
     def run_screen(self, screen_name):
         screen_class = self.screens.get(screen_name)
         if screen_class:
+            self.preload_assets(getattr(screen_class, "preload_manifest", None))
             screen_instance = screen_class(self.screen)
-            return screen_instance.run()
+            result = screen_instance.run()
+            if hasattr(screen_instance, "release_assets"):
+                screen_instance.release_assets()
+            asset_preloader.release_assets(getattr(screen_class, "preload_manifest", None))
+            return result
         return "exit"
     
     def run(self):
@@ -148,6 +160,7 @@ class Game:
                 last_time = current_time
                 
                 self.handle_events()
+                tween_scheduler.update()
                 
                 if self.in_background:
                     self.clock.tick(10)
@@ -181,8 +194,10 @@ class Game:
                     
                     if week_id == "week1":
                         from scripts_week.Week1Tutorial import Week1Tutorial
+                        self.preload_assets(Week1Tutorial.preload_manifest)
                         week_game = Week1Tutorial(self.screen)
                         week_result = week_game.run()
+                        asset_preloader.release_assets(Week1Tutorial.preload_manifest)
                     
                         self.current_screen = "main_menu"
                         self.audio_manager.play_music("songs/menu_theme.ogg", fade_in=1000)
@@ -203,6 +218,7 @@ class Game:
         
         finally:
             self.audio_manager.cleanup()
+            asset_preloader.shutdown()
             pygame.quit()
             sys.exit()
 
@@ -6,8 +6,18 @@ from .audio_manager import AudioManager
 from .transition import Transition
 from .font_renderer import CustomFontRenderer
 from .sprite_loader import SpriteLoader, Animation
+from .asset_preloader import asset_preloader
+from .font_registry import font_registry
+from .tween_scheduler import tween_scheduler
+from .mixer_service import PRIORITY_LOW
 
 class FreeplayMenu:
+    preload_manifest = {
+        "atlases": [("assets/gfDanceTitle.xml", "assets/gfDanceTitle.png")],
+        "images": ["assets/menuBG.png"],
+        "json": ["data/week_data.json"]
+    }
+
     def __init__(self, screen):
         self.screen = screen
         self.width, self.height = screen.get_size()
@@ -18,7 +28,7 @@ class FreeplayMenu:
         self.transition = Transition(screen)
         self.game_font = CustomFontRenderer("assets/fonts/bold.xml", "assets/fonts/bold.png")
 
-        self.system_font = pygame.font.Font("assets/fonts/Weight.ttf", 24)
+        self.system_font = font_registry.get_font("assets/fonts/Weight.ttf", 24, "Arial")
         self.sprites = SpriteLoader()
 
         self.setup_menu()
@@ -28,7 +38,7 @@ class FreeplayMenu:
 
     def setup_menu(self):
         try:
-            self.background = pygame.image.load("assets/menuBG.png").convert()
+            self.background = asset_preloader.get_image("assets/menuBG.png")
             self.background = pygame.transform.scale(self.background, (self.width, self.height))
         except:
             print("Error: No se pudo cargar el fondo menuBG")
@@ -44,8 +54,7 @@ class FreeplayMenu:
 
     def load_week_data(self):
         try:
-            with open("data/week_data.json", "r", encoding="utf-8") as f:
-                self.week_data = json.load(f)
+            self.week_data = asset_preloader.get_json("data/week_data.json")
             
             self.weeks = list(self.week_data.keys())
             print(f"Semanas cargadas: {self.weeks}")
@@ -119,15 +128,18 @@ class FreeplayMenu:
                     self.transition.start_fade_out(self.transition_callback, ("song_selection",))
             
                 elif event.key == pygame.K_DOWN and not self.transition.is_active():
-                    self.audio.play_sound("scroll", volume=0.7)
+                    self.audio.play_sound("scroll", volume=0.7, priority=PRIORITY_LOW)
                     self.week_index = (self.week_index + 1) % len(self.weeks)
                 
                 elif event.key == pygame.K_UP and not self.transition.is_active():
-                    self.audio.play_sound("scroll", volume=0.7)
+                    self.audio.play_sound("scroll", volume=0.7, priority=PRIORITY_LOW)
                     self.week_index = (self.week_index - 1) % len(self.weeks)
                     
         return None
 
+    def release_assets(self):
+        self.sprites.release_all()
+
     def transition_callback(self, next_screen):
         self.running = False
         self.next_screen = next_screen
@@ -143,22 +155,13 @@ class FreeplayMenu:
         return panel
 
     def draw_system_text(self, text, x, y, color=(255, 255, 255), font_size=20):
-        try:
-            font = pygame.font.Font("assets/fonts/Weight.ttf", font_size)
-            text_surface = font.render(text, True, color)
-            self.screen.blit(text_surface, (x, y))
-            return text_surface.get_rect(topleft=(x, y))
-        except:
-            font = pygame.font.SysFont("Arial", font_size)
-            text_surface = font.render(text, True, color)
-            self.screen.blit(text_surface, (x, y))
-            return text_surface.get_rect(topleft=(x, y))
+        font = font_registry.get_font("assets/fonts/Weight.ttf", font_size, "Arial")
+        text_surface = font.render(text, True, color)
+        self.screen.blit(text_surface, (x, y))
+        return text_surface.get_rect(topleft=(x, y))
 
     def draw_wrapped_system_text(self, text, x, y, max_width, color=(255, 255, 255), font_size=18):
-        try:
-            font = pygame.font.Font("assets/fonts/Weight.ttf", font_size)
-        except:
-            font = pygame.font.SysFont("Arial", font_size)
+        font = font_registry.get_font("assets/fonts/Weight.ttf", font_size, "Arial")
             
         words = text.split(' ')
         lines = []
@@ -269,14 +272,8 @@ class FreeplayMenu:
                 self.game_font.render_text(selector, week_x - 35, week_y, self.screen, scale=0.9, color=self.selected_color)
 
         if hasattr(self, "gf_anim") and self.gf_anim:
-            frame = self.gf_anim.get_current_frame()
-            if frame:
-                gf_surface = frame["surface"]
-                gf_scale = 0.3
-                gf_scaled = pygame.transform.scale(
-                    gf_surface,
-                    (int(gf_surface.get_width() * gf_scale), int(gf_surface.get_height() * gf_scale))
-                )
+            gf_scaled = self.gf_anim.get_scaled_frame(0.3)
+            if gf_scaled:
                 gf_x = (self.width - gf_scaled.get_width()) // 2
                 gf_y = self.height - gf_scaled.get_height() - 30
                 self.screen.blit(gf_scaled, (gf_x, gf_y))
@@ -303,6 +300,7 @@ class FreeplayMenu:
             if result:
                 return result
 
+            tween_scheduler.update()
             self.update(dt)
             self.draw()
             self.clock.tick(60)
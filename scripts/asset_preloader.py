@@ -0,0 +1,182 @@
+import pygame
+import io
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+from .atlas_cache import atlas_cache, read_atlas_source, build_sheet
+from .sound_index import sound_index
+
+# Un manifest describe lo que necesita una pantalla antes de construirse:
+#   {"atlases": [(xml_path, image_path), ...], "images": [path, ...], "json": [path, ...],
+#    "sounds": [nombre, ...]}   (los nombres se resuelven con sound_index)
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+def _read_json(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+class AssetPreloader:
+    """Carga assets en un pool de hilos y los termina en el hilo principal.
+
+    Los hilos solo hacen I/O y parseo: devuelven bytes (pixeles RGBA de
+    los bundles, PNG/OGG tal cual del disco) y datos de XML/JSON, nunca
+    objetos de pygame. Las Surface y los Sound se arman en poll(), en el
+    hilo principal, repartidos entre frames con un presupuesto de tiempo.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="asset_loader")
+        self.images: Dict[str, pygame.Surface] = {}
+        self.json_data: Dict[str, object] = {}
+        # Assets que no existen o no se pudieron cargar: como sound_index.missing,
+        # no se vuelven a encolar (ni a mostrar el LoadingScreen) en cada pantalla
+        self.failed: Set[Tuple[str, object]] = set()
+        # Atlas precargados con una referencia propia, para que el LRU no los
+        # expulse antes de que la pantalla los adquiera; ver release_assets
+        self.pinned: Set[Tuple[str, str]] = set()
+
+        self.pending: List[Tuple[str, object, object]] = []
+        self.total_jobs = 0
+        self.finished_jobs = 0
+
+    def is_ready(self, manifest: Dict) -> bool:
+        return not self._missing_jobs(manifest)
+
+    def start(self, manifest: Dict):
+        jobs = self._missing_jobs(manifest)
+
+        for kind, key in jobs:
+            if kind == "atlas":
+                future = self.executor.submit(read_atlas_source, *key)
+            elif kind == "image":
+                future = self.executor.submit(_read_bytes, key)
+            elif kind == "sound":
+                future = self.executor.submit(_read_bytes, sound_index.find(key))
+            else:
+                future = self.executor.submit(_read_json, key)
+            self.pending.append((kind, key, future))
+
+        self.total_jobs += len(jobs)
+
+    def poll(self, time_budget_ms: float = 8.0) -> float:
+        deadline = time.perf_counter() + time_budget_ms / 1000.0
+
+        for job in list(self.pending):
+            kind, key, future = job
+            if not future.done():
+                continue
+
+            self.pending.remove(job)
+            self.finished_jobs += 1
+            try:
+                self._finish_job(kind, key, future.result())
+            except Exception as e:
+                print(f"Error cargando asset {key}: {e}")
+                self._mark_failed(kind, key)
+
+            if time.perf_counter() >= deadline:
+                break
+
+        return self.get_progress()
+
+    def get_progress(self) -> float:
+        if self.total_jobs == 0:
+            return 1.0
+        return self.finished_jobs / self.total_jobs
+
+    def is_done(self) -> bool:
+        return not self.pending
+
+    def reset_progress(self):
+        if not self.pending:
+            self.total_jobs = 0
+            self.finished_jobs = 0
+
+    def get_image(self, path: str) -> pygame.Surface:
+        image = self.images.get(path)
+        if image is None:
+            image = pygame.image.load(path).convert()
+            self.images[path] = image
+        return image
+
+    def get_json(self, path: str):
+        if path not in self.json_data:
+            self.json_data[path] = _read_json(path)
+        return self.json_data[path]
+
+    def release_assets(self, manifest: Optional[Dict]):
+        # La pantalla del manifest termino: sus atlas vuelven a ser expulsables
+        if not manifest:
+            return
+        for xml_path, image_path in manifest.get("atlases", []):
+            key = (xml_path, image_path)
+            if key in self.pinned:
+                self.pinned.discard(key)
+                atlas_cache.release(xml_path, image_path)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _finish_job(self, kind: str, key, result):
+        if kind == "atlas":
+            if result is None:
+                self._mark_failed(kind, key)
+            else:
+                pixels, size, frames = result
+                pin = key not in self.pinned
+                atlas_cache.store(key[0], key[1], build_sheet(pixels, size, key[1]), frames, pin=pin)
+                self.pinned.add(key)
+        elif kind == "image":
+            self.images[key] = pygame.image.load(io.BytesIO(result), key).convert()
+        elif kind == "sound":
+            sound_index.store(key, pygame.mixer.Sound(file=io.BytesIO(result)))
+        else:
+            self.json_data[key] = result
+
+    def _mark_failed(self, kind: str, key):
+        if kind == "sound":
+            sound_index.missing.add(key)
+        else:
+            self.failed.add((kind, key))
+
+    def _missing_jobs(self, manifest: Dict) -> List[Tuple[str, object]]:
+        queued = {(kind, key) for kind, key, _ in self.pending}
+        candidates = []
+
+        for xml_path, image_path in manifest.get("atlases", []):
+            if not atlas_cache.is_cached(xml_path, image_path):
+                candidates.append(("atlas", (xml_path, image_path), image_path))
+
+        for path in manifest.get("images", []):
+            if path not in self.images:
+                candidates.append(("image", path, path))
+
+        for path in manifest.get("json", []):
+            if path not in self.json_data:
+                candidates.append(("json", path, path))
+
+        jobs = []
+        for kind, key, path in candidates:
+            job = (kind, key)
+            if job in self.failed or job in queued:
+                continue
+            if not os.path.exists(path):
+                print(f"AssetPreloader: Archivo no encontrado: {path}")
+                self.failed.add(job)
+                continue
+            jobs.append(job)
+
+        if pygame.mixer.get_init():
+            # sound_index ya recuerda los nombres que faltan o fallaron
+            for sound_name in sound_index.get_missing_paths(manifest.get("sounds", [])):
+                if ("sound", sound_name) not in queued:
+                    jobs.append(("sound", sound_name))
+
+        return jobs
+
+asset_preloader = AssetPreloader()
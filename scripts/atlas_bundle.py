@@ -0,0 +1,142 @@
+import pygame
+import xml.etree.ElementTree as ET
+import os
+import sys
+import struct
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+# Formato .fnfatlas (little endian):
+#   cabecera   -> magic, version, ancho, alto, numero de frames, bytes de nombres
+#   tabla      -> 8 enteros int32 por frame (x, y, w, h, frameX, frameY, frameW, frameH)
+#   nombres    -> nombres de los frames en UTF-8 separados por '\n'
+#   pixeles    -> ancho * alto * 4 bytes RGBA
+BUNDLE_EXTENSION = ".fnfatlas"
+BUNDLE_MAGIC = b"FNFA"
+BUNDLE_VERSION = 1
+HEADER = struct.Struct("<4sHxxIIII")
+FRAME_FIELDS = ('x', 'y', 'width', 'height', 'frameX', 'frameY', 'frameWidth', 'frameHeight')
+
+def parse_sparrow_xml(xml_path: str) -> List[Dict]:
+    tree = ET.parse(xml_path)
+    root = tree.getroot()
+
+    frames = []
+    for subtexture in root.findall('SubTexture'):
+        frames.append({
+            'name': subtexture.get('name'),
+            'x': int(subtexture.get('x')),
+            'y': int(subtexture.get('y')),
+            'width': int(subtexture.get('width')),
+            'height': int(subtexture.get('height')),
+            'frameX': int(subtexture.get('frameX', 0)),
+            'frameY': int(subtexture.get('frameY', 0)),
+            'frameWidth': int(subtexture.get('frameWidth', int(subtexture.get('width')))),
+            'frameHeight': int(subtexture.get('frameHeight', int(subtexture.get('height'))))
+        })
+    return frames
+
+def get_bundle_path(image_path: str) -> str:
+    return os.path.splitext(image_path)[0] + BUNDLE_EXTENSION
+
+def is_bundle_fresh(bundle_path: str, xml_path: str, image_path: str) -> bool:
+    if not os.path.exists(bundle_path):
+        return False
+
+    bundle_mtime = os.path.getmtime(bundle_path)
+    for source in (xml_path, image_path):
+        if os.path.exists(source) and os.path.getmtime(source) > bundle_mtime:
+            return False
+    return True
+
+def compile_bundle(xml_path: str, image_path: str, bundle_path: Optional[str] = None) -> str:
+    bundle_path = bundle_path or get_bundle_path(image_path)
+
+    frames = parse_sparrow_xml(xml_path)
+    sheet = pygame.image.load(image_path)
+    width, height = sheet.get_size()
+    pixels = pygame.image.tobytes(sheet, 'RGBA')
+
+    table = array('i')
+    for frame in frames:
+        table.extend(frame[field] for field in FRAME_FIELDS)
+    if sys.byteorder != 'little':
+        table.byteswap()
+
+    names = "\n".join(frame['name'] for frame in frames).encode('utf-8')
+
+    tmp_path = bundle_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, width, height, len(frames), len(names)))
+        f.write(table.tobytes())
+        f.write(names)
+        f.write(pixels)
+    os.replace(tmp_path, bundle_path)
+    return bundle_path
+
+def read_bundle(bundle_path: str) -> Optional[Tuple[memoryview, Tuple[int, int], List[Dict]]]:
+    # Solo bytes: los pixeles RGBA se devuelven sin crear la Surface, asi
+    # se puede llamar desde un hilo de carga
+    with open(bundle_path, 'rb') as f:
+        data = f.read()
+
+    if len(data) < HEADER.size:
+        return None
+
+    magic, version, width, height, frame_count, names_size = HEADER.unpack_from(data, 0)
+    if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+        return None
+
+    offset = HEADER.size
+    table = array('i')
+    table_size = frame_count * len(FRAME_FIELDS) * table.itemsize
+    table.frombytes(data[offset:offset + table_size])
+    if sys.byteorder != 'little':
+        table.byteswap()
+    offset += table_size
+
+    names = data[offset:offset + names_size].decode('utf-8').split("\n") if frame_count else []
+    offset += names_size
+
+    if len(data) - offset != width * height * 4:
+        return None
+
+    pixels = memoryview(data)[offset:]
+
+    field_count = len(FRAME_FIELDS)
+    frames = []
+    for i, name in enumerate(names):
+        frame = {'name': name}
+        frame.update(zip(FRAME_FIELDS, table[i * field_count:(i + 1) * field_count]))
+        frames.append(frame)
+
+    return pixels, (width, height), frames
+
+def compile_directory(root_dir: str) -> int:
+    compiled = 0
+    for dirpath, _, filenames in os.walk(root_dir):
+        for filename in filenames:
+            if not filename.lower().endswith(".xml"):
+                continue
+
+            xml_path = os.path.join(dirpath, filename)
+            image_path = os.path.splitext(xml_path)[0] + ".png"
+            if not os.path.exists(image_path):
+                continue
+
+            if is_bundle_fresh(get_bundle_path(image_path), xml_path, image_path):
+                print(f"Al dia: {xml_path}")
+                continue
+
+            try:
+                bundle_path = compile_bundle(xml_path, image_path)
+                print(f"Compilado: {bundle_path}")
+                compiled += 1
+            except Exception as e:
+                print(f"Error compilando {xml_path}: {e}")
+    return compiled
+
+if __name__ == "__main__":
+    directories = sys.argv[1:] or ["assets"]
+    total = sum(compile_directory(directory) for directory in directories)
+    print(f"Atlas compilados: {total}")
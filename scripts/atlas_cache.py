@@ -0,0 +1,280 @@
+import pygame
+import io
+import os
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from .graphics_config import load_graphics_config
+from .atlas_bundle import parse_sparrow_xml, get_bundle_path, is_bundle_fresh, read_bundle
+
+AtlasKey = Tuple[str, str]
+# (pixeles, tamaño, frames): tamaño None si los pixeles son el PNG sin decodificar
+AtlasSource = Tuple[Union[bytes, memoryview], Optional[Tuple[int, int]], List[Dict]]
+
+class LazyFrame(dict):
+    """Metadatos de un SubTexture; 'surface' se recorta la primera vez que se pide."""
+
+    __slots__ = ('index',)
+
+    def __init__(self, index: "FrameIndex", frame_data: Dict):
+        super().__init__(frame_data)
+        self.index = index
+
+    def __missing__(self, key):
+        if key != 'surface':
+            raise KeyError(key)
+        return self.index.materialize(self)
+
+    def get(self, key, default=None):
+        if key == 'surface':
+            return self['surface']
+        return super().get(key, default)
+
+class FrameIndex:
+    """Frames de un atlas en orden del XML, accesibles por posicion o por nombre.
+
+    Se comporta como la lista que devolvia load_sprite_sheet (len, iteracion,
+    indices enteros) y ademas como un dict por nombre (get, items, values,
+    'nombre' in frames). Ningun frame ocupa memoria hasta que se pide su
+    'surface'.
+    """
+
+    def __init__(self, sheet: pygame.Surface, frames: List[Dict], use_subsurfaces: bool = True):
+        self.sheet = sheet
+        self.use_subsurfaces = use_subsurfaces
+        self.frames = [LazyFrame(self, frame_data) for frame_data in frames]
+        self.by_name: Dict[str, LazyFrame] = {}
+        for frame in self.frames:
+            self.by_name.setdefault(frame['name'], frame)
+
+        self.sheet_bytes = sheet.get_width() * sheet.get_height() * sheet.get_bytesize()
+        self.materialized_bytes = 0
+        self.materialized_count = 0
+        # El AtlasCache se entera de cada copia para llevar su contador de bytes
+        self.on_grow = None
+
+    def materialize(self, frame: LazyFrame) -> pygame.Surface:
+        sheet_rect = self.sheet.get_rect()
+        frame_rect = pygame.Rect(frame['x'], frame['y'], frame['width'], frame['height'])
+
+        if self.use_subsurfaces:
+            surface = self.sheet.subsurface(frame_rect.clip(sheet_rect))
+            frame['shared'] = True
+        else:
+            surface = pygame.Surface(frame_rect.size, pygame.SRCALPHA)
+            surface.blit(self.sheet, (0, 0), frame_rect)
+            frame['shared'] = False
+            grown = frame_rect.width * frame_rect.height * surface.get_bytesize()
+            self.materialized_bytes += grown
+            if self.on_grow:
+                self.on_grow(grown)
+
+        dict.__setitem__(frame, 'surface', surface)
+        self.materialized_count += 1
+        return surface
+
+    def get_resident_bytes(self) -> int:
+        return self.sheet_bytes + self.materialized_bytes
+
+    def with_prefix(self, prefix: str) -> List[LazyFrame]:
+        return [frame for frame in self.frames if frame['name'].startswith(prefix)]
+
+    def get(self, name: str, default=None):
+        return self.by_name.get(name, default)
+
+    def keys(self):
+        return self.by_name.keys()
+
+    def values(self):
+        return self.by_name.values()
+
+    def items(self):
+        return self.by_name.items()
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __iter__(self) -> Iterator[LazyFrame]:
+        return iter(self.frames)
+
+    def __getitem__(self, key: Union[int, slice, str]):
+        if isinstance(key, str):
+            return self.by_name[key]
+        return self.frames[key]
+
+    def __contains__(self, item) -> bool:
+        if isinstance(item, str):
+            return item in self.by_name
+        return item in self.frames
+
+class AtlasEntry:
+    def __init__(self, frames: FrameIndex):
+        self.frames = frames
+        self.ref_count = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self.frames.get_resident_bytes()
+
+class AtlasCache:
+    """Cache de spritesheets compartido por todas las pantallas.
+
+    Las entradas se identifican por (xml_path, image_path). Mientras un
+    SpriteLoader tenga una referencia la entrada nunca se expulsa; las
+    que quedan sin referencias se expulsan en orden LRU cuando se supera
+    el presupuesto de bytes.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, use_subsurfaces: Optional[bool] = None):
+        config = load_graphics_config()
+        if max_bytes is None:
+            max_bytes = int(config.get("atlas_cache_budget_mb", 384) * 1024 * 1024)
+        if use_subsurfaces is None:
+            use_subsurfaces = config.get("use_subsurface_frames", True)
+
+        self.max_bytes = max_bytes
+        self.use_subsurfaces = use_subsurfaces
+        self.entries: "OrderedDict[AtlasKey, AtlasEntry]" = OrderedDict()
+        # Contador incremental: _evict lo consulta en cada vuelta
+        self.total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, xml_path: str, image_path: str) -> Optional[FrameIndex]:
+        key = (xml_path, image_path)
+        entry = self.entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            entry = self._load_entry(xml_path, image_path)
+            if entry is None:
+                return None
+            self._add(key, entry)
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+
+        entry.ref_count += 1
+        self._evict()
+        return entry.frames
+
+    def release(self, xml_path: str, image_path: str):
+        entry = self.entries.get((xml_path, image_path))
+        if entry is None or entry.ref_count == 0:
+            return
+
+        entry.ref_count -= 1
+        self._evict()
+
+    def is_cached(self, xml_path: str, image_path: str) -> bool:
+        return (xml_path, image_path) in self.entries
+
+    def store(self, xml_path: str, image_path: str, sheet: pygame.Surface, frames: List[Dict],
+              pin: bool = False):
+        # pin=True guarda la entrada ya con una referencia (se suelta con release)
+        key = (xml_path, image_path)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = AtlasEntry(FrameIndex(sheet, frames, self.use_subsurfaces))
+            self._add(key, entry)
+
+        if pin:
+            entry.ref_count += 1
+        self._evict()
+
+    def set_max_bytes(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self):
+        for key in [k for k, e in self.entries.items() if e.ref_count == 0]:
+            self._remove(key)
+
+    def get_stats(self) -> Dict:
+        return {
+            "entries": len(self.entries),
+            "total_bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    def _evict(self):
+        if self.total_bytes <= self.max_bytes:
+            return
+
+        for key in list(self.entries.keys()):
+            if self.total_bytes <= self.max_bytes:
+                break
+            if self.entries[key].ref_count == 0:
+                self._remove(key)
+
+    def _add(self, key: AtlasKey, entry: AtlasEntry):
+        self.entries[key] = entry
+        self.total_bytes += entry.size_bytes
+        entry.frames.on_grow = self._on_grow
+
+    def _on_grow(self, grown: int):
+        self.total_bytes += grown
+
+    def _remove(self, key: AtlasKey):
+        entry = self.entries.pop(key)
+        entry.frames.on_grow = None
+        self.total_bytes -= entry.size_bytes
+
+    def _load_entry(self, xml_path: str, image_path: str) -> Optional[AtlasEntry]:
+        try:
+            loaded = read_atlas_source(xml_path, image_path)
+            if loaded is None:
+                return None
+            pixels, size, frames = loaded
+            return AtlasEntry(FrameIndex(build_sheet(pixels, size, image_path), frames, self.use_subsurfaces))
+
+        except Exception as e:
+            print(f"Error cargando spritesheet: {e}")
+            return None
+
+def read_atlas_source(xml_path: str, image_path: str) -> Optional[AtlasSource]:
+    """Lee los pixeles del sheet y sus frames sin crear Surfaces (seguro en hilos).
+
+    Con un bundle fresco los pixeles ya son RGBA crudos; si no, son los
+    bytes del PNG. La Surface la arma build_sheet() en el hilo principal.
+    """
+    bundle_path = get_bundle_path(image_path)
+    if is_bundle_fresh(bundle_path, xml_path, image_path):
+        try:
+            loaded = read_bundle(bundle_path)
+            if loaded is not None:
+                return loaded
+            print(f"Bundle invalido, usando XML: {bundle_path}")
+        except Exception as e:
+            print(f"Error leyendo bundle {bundle_path}: {e}")
+
+    if not os.path.exists(image_path):
+        print(f"Error: No se encuentra la imagen {image_path}")
+        return None
+
+    with open(image_path, 'rb') as f:
+        encoded = f.read()
+
+    if not os.path.exists(xml_path):
+        print(f"Error: No se encuentra el XML {xml_path}")
+        return None
+
+    return encoded, None, parse_sparrow_xml(xml_path)
+
+def build_sheet(pixels, size: Optional[Tuple[int, int]], image_path: str) -> pygame.Surface:
+    # Hilo principal: frombuffer/convert_alpha necesitan el display
+    if size is None:
+        return pygame.image.load(io.BytesIO(pixels), image_path).convert_alpha()
+    return pygame.image.frombuffer(pixels, size, 'RGBA').convert_alpha()
+
+def get_writable_surface(frame: Dict) -> pygame.Surface:
+    """Copia privada del frame para poder modificarla (alpha, colorkey, fill...).
+
+    Los frames del cache se comparten entre pantallas y, en modo subsurface,
+    tambien con el sheet original, asi que nunca deben modificarse en sitio.
+    """
+    return frame['surface'].copy()
+
+atlas_cache = AtlasCache()
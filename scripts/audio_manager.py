@@ -2,10 +2,11 @@ import pygame
 import os
 import json
 import time
-import threading
 from typing import Dict, List, Optional, Callable, Tuple
 from enum import Enum
-from dataclasses import dataclass
+from .tween_scheduler import tween_scheduler
+from .mixer_service import mixer_service, PRIORITY_NORMAL
+from .sound_index import sound_index
 
 class AudioState(Enum):
     STOPPED = "stopped"
@@ -13,15 +14,6 @@ class AudioState(Enum):
     PAUSED = "paused"
     FADING = "fading"
 
-@dataclass
-class SoundInstance:
-    sound: pygame.mixer.Sound
-    channel: Optional[pygame.mixer.Channel]
-    volume: float
-    pan: float
-    loop: bool
-    start_time: float
-
 class AudioManager:
     _instance = None
     _initialized = False
@@ -35,21 +27,9 @@ class AudioManager:
         if self._initialized:
             return
             
-        try:
-            pygame.mixer.init(
-                frequency=44100,
-                size=-16,
-                channels=2,
-                buffer=1024
-            )
-            pygame.mixer.set_num_channels(16)
-        except pygame.error as e:
-            print(f"AudioManager Error: {e}")
-            try:
-                pygame.mixer.init()
-            except pygame.error as e2:
-                print(f"AudioManager Critical Error: {e2}")
-                return
+        # El mixer lo abre MixerService con la latencia y canales de la config
+        if not mixer_service.init():
+            return
         
         self.music_volume = 0.7
         self.sfx_volume = 0.8
@@ -57,10 +37,8 @@ class AudioManager:
         
         self.current_music = None
         self.music_state = AudioState.STOPPED
-        self.music_fade_thread = None
         self.music_start_time = 0
         
-        self.sound_instances: Dict[str, SoundInstance] = {}
         self.loaded_sounds: Dict[str, pygame.mixer.Sound] = {}
         
         self.config = self.load_config()
@@ -74,6 +52,7 @@ class AudioManager:
             "master_volume": 1.0,
             "preload_sounds": True,
             "audio_latency": 100,
+            "mixer_latency_ms": 20,
             "max_simultaneous_sounds": 8,
             "default_fade_duration": 1000
         }
@@ -89,34 +68,18 @@ class AudioManager:
         return default_config
     
     def _find_sound_file(self, sound_name: str) -> Optional[str]:
-        possible_paths = [
-            f"audio/sfx/{sound_name}.ogg",
-            f"assets/sounds/{sound_name}.ogg",
-            f"sounds/{sound_name}.ogg",
-            f"{sound_name}.ogg"
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-        return None
+        return sound_index.find(sound_name)
     
     def load_sound(self, sound_name: str) -> Optional[pygame.mixer.Sound]:
         if sound_name in self.loaded_sounds:
             return self.loaded_sounds[sound_name]
         
-        sound_path = self._find_sound_file(sound_name)
-        if not sound_path:
-            print(f"AudioManager: Sound file not found: {sound_name}")
-            return None
-        
-        try:
-            sound = pygame.mixer.Sound(sound_path)
+        # Indice armado al arrancar: sin probar rutas con os.path.exists y
+        # con los faltantes cacheados
+        sound = sound_index.get_sound(sound_name)
+        if sound is not None:
             self.loaded_sounds[sound_name] = sound
-            return sound
-        except pygame.error as e:
-            print(f"AudioManager: Error loading sound {sound_name}: {e}")
-            return None
+        return sound
     
     def preload_sounds(self, sound_dict: Dict[str, str]):
         if not self.config.get("preload_sounds", True):
@@ -141,8 +104,8 @@ class AudioManager:
             return
         
         try:
-            if self.music_fade_thread and self.music_fade_thread.is_alive():
-                self.music_fade_thread.join(timeout=0.1)
+            # Un fade anterior (p.ej. un fade out a medio camino) se descarta
+            tween_scheduler.cancel_tag("music_fade")
             
             if self.music_state != AudioState.STOPPED:
                 pygame.mixer.music.stop()
@@ -151,15 +114,8 @@ class AudioManager:
             
             if fade_in > 0:
                 self.music_state = AudioState.FADING
-                pygame.mixer.music.set_volume(0.0)
                 pygame.mixer.music.play(-1 if loop else 0)
-                
-                self.music_fade_thread = threading.Thread(
-                    target=self._fade_music_volume, 
-                    args=(0.0, self.music_volume * self.master_volume, fade_in, False)
-                )
-                self.music_fade_thread.daemon = True
-                self.music_fade_thread.start()
+                self._fade_music_volume(0.0, self.music_volume * self.master_volume, fade_in, False)
             else:
                 pygame.mixer.music.play(-1 if loop else 0)
                 pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
@@ -179,15 +135,11 @@ class AudioManager:
             
         fade_duration = fade_out if fade_out > 0 else self.config.get("default_fade_duration", 1000)
         
+        tween_scheduler.cancel_tag("music_fade")
         if fade_duration > 0:
             self.music_state = AudioState.FADING
             current_volume = pygame.mixer.music.get_volume()
-            self.music_fade_thread = threading.Thread(
-                target=self._fade_music_volume,
-                args=(current_volume, 0.0, fade_duration, True)
-            )
-            self.music_fade_thread.daemon = True
-            self.music_fade_thread.start()
+            self._fade_music_volume(current_volume, 0.0, fade_duration, True)
         else:
             pygame.mixer.music.stop()
             self.music_state = AudioState.STOPPED
@@ -203,48 +155,22 @@ class AudioManager:
             pygame.mixer.music.unpause()
             self.music_state = AudioState.PLAYING
     
-    def play_sound(self, sound_name: str, volume: float = 1.0, pan: float = 0.0, loop: bool = False) -> Optional[str]:
-        instance_id = f"{sound_name}_{int(time.time() * 1000)}"
-        
+    def play_sound(self, sound_name: str, volume: float = 1.0, pan: float = 0.0, loop: bool = False,
+                   priority: int = PRIORITY_NORMAL) -> Optional[int]:
         sound = self.load_sound(sound_name)
         if sound is None:
             return None
         
-        channel = pygame.mixer.find_channel()
-        if channel is None:
-            channel = self._find_stoppable_channel()
-            if channel is None:
-                return None
-        
-        final_volume = volume * self.sfx_volume * self.master_volume
-        sound.set_volume(final_volume)
-        
-        self._set_channel_pan(channel, pan, final_volume)
-        
-        if loop:
-            channel.play(sound, loops=-1)
-        else:
-            channel.play(sound)
-        
-        self.sound_instances[instance_id] = SoundInstance(
-            sound=sound,
-            channel=channel,
-            volume=final_volume,
-            pan=pan,
-            loop=loop,
-            start_time=time.time()
-        )
+        # La voz sale del pool compartido (MixerService); el id que devuelve
+        # no se repite aunque se llame varias veces en el mismo milisegundo
+        voice = mixer_service.play(sound, loops=-1 if loop else 0, priority=priority)
+        if voice is None:
+            return None
         
-        return instance_id
-    
-    def _find_stoppable_channel(self) -> Optional[pygame.mixer.Channel]:
-        for instance in self.sound_instances.values():
-            if (instance.channel and instance.channel.get_busy() and 
-                not instance.loop and 
-                (time.time() - instance.start_time) > 2.0):
-                instance.channel.stop()
-                return instance.channel
-        return None
+        voice.volume = volume
+        voice.pan = pan
+        self._set_channel_pan(voice.channel, pan, volume * self.sfx_volume * self.master_volume)
+        return voice.id
     
     def _set_channel_pan(self, channel: pygame.mixer.Channel, pan: float, volume: float):
         left_volume = volume * (1.0 - max(0, pan))
@@ -255,16 +181,11 @@ class AudioManager:
         except TypeError:
             channel.set_volume((left_volume + right_volume) / 2)
     
-    def stop_sound(self, instance_id: str):
-        if instance_id in self.sound_instances:
-            instance = self.sound_instances[instance_id]
-            if instance.channel and instance.channel.get_busy():
-                instance.channel.stop()
-            del self.sound_instances[instance_id]
+    def stop_sound(self, instance_id: int):
+        mixer_service.stop(instance_id)
     
     def stop_all_sounds(self):
-        for instance_id in list(self.sound_instances.keys()):
-            self.stop_sound(instance_id)
+        mixer_service.stop_all()
     
     def set_music_volume(self, volume: float):
         self.music_volume = max(0.0, min(1.0, volume))
@@ -277,11 +198,10 @@ class AudioManager:
         self.sfx_volume = max(0.0, min(1.0, volume))
         self.config["sfx_volume"] = self.sfx_volume
         
-        for instance in self.sound_instances.values():
-            if instance.channel and instance.channel.get_busy():
-                final_volume = instance.volume * (self.sfx_volume / 0.8) * self.master_volume
-                instance.sound.set_volume(final_volume)
-                self._set_channel_pan(instance.channel, instance.pan, final_volume)
+        if mixer_service.voice_pool:
+            for voice in mixer_service.voice_pool.get_active_voices():
+                final_volume = voice.volume * self.sfx_volume * self.master_volume
+                self._set_channel_pan(voice.channel, voice.pan, final_volume)
     
     def set_master_volume(self, volume: float):
         self.master_volume = max(0.0, min(1.0, volume))
@@ -289,28 +209,60 @@ class AudioManager:
         self.set_music_volume(self.music_volume)
         self.set_sfx_volume(self.sfx_volume)
     
-    def _fade_music_volume(self, start_vol: float, end_vol: float, duration: int, stop_after: bool = False):
-        steps = max(1, int(duration / 50))
-        step_duration = duration / steps
+    def crossfade_music(self, music_path: str, duration: int = 0, loop: bool = True):
+        # pygame.mixer.music tiene un solo stream: la mitad del tiempo baja
+        # la pista actual y la otra mitad sube la nueva
+        duration = duration or self.config.get("default_fade_duration", 1000)
+        if self.music_state == AudioState.STOPPED or self.current_music == music_path:
+            self.play_music(music_path, fade_in=duration, loop=loop)
+            return
         
-        for i in range(steps + 1):
-            progress = i / steps
-            current_vol = start_vol + (end_vol - start_vol) * progress
-            try:
-                pygame.mixer.music.set_volume(current_vol)
-                time.sleep(step_duration / 1000)
-            except Exception as e:
-                break
+        tween_scheduler.cancel_tag("music_fade")
+        self.music_state = AudioState.FADING
+        tween_scheduler.tween(
+            pygame.mixer.music.set_volume, pygame.mixer.music.get_volume(), 0.0, duration / 2,
+            on_complete=lambda: self._start_crossfade_track(music_path, duration / 2, loop),
+            tag="music_fade"
+        )
+    
+    def _start_crossfade_track(self, music_path: str, fade_in: float, loop: bool):
+        self.music_state = AudioState.STOPPED
+        self.current_music = None
+        self.play_music(music_path, fade_in=max(1, int(fade_in)), loop=loop)
+    
+    def fade_sound(self, instance_id: int, end_volume: float, duration: int, stop_after: bool = False):
+        voice = mixer_service.get_voice(instance_id)
+        if not voice:
+            return
         
-        if stop_after:
-            try:
-                pygame.mixer.music.stop()
-                self.music_state = AudioState.STOPPED
-                self.current_music = None
-            except Exception as e:
-                print(f"AudioManager: Error stopping music: {e}")
-        else:
-            self.music_state = AudioState.PLAYING
+        def set_volume(volume: float):
+            # Si la voz fue robada o reciclada el tween ya no la toca
+            if voice.id == instance_id:
+                voice.volume = volume
+                self._set_channel_pan(voice.channel, voice.pan, volume * self.sfx_volume * self.master_volume)
+        
+        on_complete = (lambda: self.stop_sound(instance_id)) if stop_after else None
+        tween_scheduler.cancel_tag(f"sound_fade:{instance_id}")
+        tween_scheduler.tween(set_volume, voice.volume, end_volume, duration,
+                              on_complete=on_complete, tag=f"sound_fade:{instance_id}")
+    
+    def _fade_music_volume(self, start_vol: float, end_vol: float, duration: int, stop_after: bool = False):
+        # El tween avanza con tween_scheduler.update() en el loop de cada
+        # pantalla; el estado solo se toca desde el hilo principal
+        on_complete = self._finish_fade_out if stop_after else self._finish_fade_in
+        tween_scheduler.tween(pygame.mixer.music.set_volume, start_vol, end_vol, duration,
+                              on_complete=on_complete, tag="music_fade")
+    
+    def _finish_fade_in(self):
+        self.music_state = AudioState.PLAYING
+    
+    def _finish_fade_out(self):
+        try:
+            pygame.mixer.music.stop()
+            self.music_state = AudioState.STOPPED
+            self.current_music = None
+        except Exception as e:
+            print(f"AudioManager: Error stopping music: {e}")
     
     def get_music_position(self) -> float:
         if self.music_state == AudioState.PLAYING:
@@ -337,13 +289,9 @@ class AudioManager:
     def cleanup(self):
         try:
             pygame.mixer.music.stop()
-            for instance in self.sound_instances.values():
-                if instance.channel and instance.channel.get_busy():
-                    instance.channel.stop()
-            self.sound_instances.clear()
+            mixer_service.stop_all()
             self.loaded_sounds.clear()
-            if self.music_fade_thread and self.music_fade_thread.is_alive():
-                self.music_fade_thread.join(timeout=0.5)
+            tween_scheduler.cancel_tag("music_fade")
             self.save_config()
         except Exception as e:
             print(f"AudioManager: Cleanup error: {e}")
@@ -354,6 +302,7 @@ class AudioManager:
             os.makedirs(os.path.dirname(config_path), exist_ok=True)
             with open(config_path, 'w') as f:
                 json.dump(self.config, f, indent=4)
+                f.write("\n")
         except Exception as e:
             print(f"AudioManager: Error saving config: {e}")
     
@@ -3,8 +3,14 @@ import sys
 from .audio_manager import AudioManager
 from .transition import Transition
 from .font_renderer import CustomFontRenderer 
+from .asset_preloader import asset_preloader
+from .tween_scheduler import tween_scheduler
 
 class CreditsMenu:
+    preload_manifest = {
+        "images": ["assets/menuBGBlue.png"]
+    }
+    
     def __init__(self, screen):
         self.screen = screen
         self.width, self.height = screen.get_size()
@@ -20,7 +26,7 @@ class CreditsMenu:
     
     def setup_elements(self):
         try:
-            self.background = pygame.image.load("assets/menuBGBlue.png").convert()
+            self.background = asset_preloader.get_image("assets/menuBGBlue.png")
             self.background = pygame.transform.scale(self.background, (self.width, self.height))
         except:
             print("Error: No se pudo cargar el fondo menuBGBlue")
@@ -88,6 +94,7 @@ class CreditsMenu:
             if result:
                 return result
             
+            tween_scheduler.update()
             self.update(dt)
             self.draw()
             self.clock.tick(60)
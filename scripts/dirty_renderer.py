@@ -0,0 +1,117 @@
+import pygame
+from typing import Dict, List, Optional, Tuple
+from .graphics_config import load_graphics_config
+
+class DirtyRectRenderer:
+    """Redibuja solo las zonas de pantalla que cambiaron entre frames.
+
+    Cada frame la pantalla pasa la lista de elementos (key, surface, pos,
+    version). Un elemento cambia si su rect o su version (por defecto la
+    surface) no coinciden con el frame anterior; su rect viejo y el nuevo
+    se marcan sucios, se fusionan y solo esas zonas se restauran y se
+    envian con pygame.display.update(). Con enabled=False (o force_full)
+    se dibuja todo y se hace flip como siempre.
+    """
+
+    def __init__(self, screen, background: Optional[pygame.Surface] = None,
+                 background_color: Tuple[int, int, int] = (0, 0, 0),
+                 enabled: Optional[bool] = None):
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.background = background
+        self.background_color = background_color
+
+        if enabled is None:
+            enabled = load_graphics_config().get("dirty_rect_rendering", False)
+        self.enabled = enabled
+
+        # Si las zonas sucias cubren mas que esto, sale mas barato un flip
+        self.full_redraw_ratio = 0.6
+
+        self.previous: Dict[str, Tuple[pygame.Rect, object]] = {}
+        self.update_rects: List[pygame.Rect] = []
+        self.needs_full_redraw = True
+        self.pending_flip = True
+
+    def invalidate(self):
+        self.needs_full_redraw = True
+
+    def draw(self, elements, force_full: bool = False):
+        current = {}
+        for key, surface, pos, version in elements:
+            rect = surface.get_rect(topleft=(int(pos[0]), int(pos[1])))
+            current[key] = (rect, surface if version is None else version)
+
+        full = force_full or not self.enabled or self.needs_full_redraw
+        dirty = [] if full else self._collect_dirty(current)
+
+        if not full:
+            dirty = self._merge_rects(dirty)
+            dirty_area = sum(rect.width * rect.height for rect in dirty)
+            full = dirty_area > self.screen_rect.width * self.screen_rect.height * self.full_redraw_ratio
+
+        if full:
+            self._draw_region(elements, None)
+            self.pending_flip = True
+            self.update_rects = []
+        else:
+            for rect in dirty:
+                self._draw_region(elements, rect)
+            self.pending_flip = False
+            self.update_rects = dirty
+
+        self.previous = current
+        # Tras un frame forzado (p.ej. una transicion) el siguiente tambien
+        # debe ser completo para limpiar lo que dibujo el overlay
+        self.needs_full_redraw = force_full
+
+    def present(self):
+        if self.pending_flip:
+            pygame.display.flip()
+        elif self.update_rects:
+            pygame.display.update(self.update_rects)
+
+    def _collect_dirty(self, current) -> List[pygame.Rect]:
+        dirty = []
+        for key, (rect, version) in current.items():
+            previous = self.previous.get(key)
+            if previous is None:
+                dirty.append(rect)
+            elif previous[0] != rect or (previous[1] is not version and previous[1] != version):
+                dirty.append(previous[0])
+                dirty.append(rect)
+
+        for key, (rect, _) in self.previous.items():
+            if key not in current:
+                dirty.append(rect)
+
+        return [rect.clip(self.screen_rect) for rect in dirty if rect.colliderect(self.screen_rect)]
+
+    def _merge_rects(self, rects: List[pygame.Rect]) -> List[pygame.Rect]:
+        merged: List[pygame.Rect] = []
+        for rect in rects:
+            rect = rect.copy()
+            i = 0
+            while i < len(merged):
+                if rect.colliderect(merged[i]):
+                    rect.union_ip(merged.pop(i))
+                    i = 0
+                else:
+                    i += 1
+            merged.append(rect)
+        return merged
+
+    def _draw_region(self, elements, rect: Optional[pygame.Rect]):
+        self.screen.set_clip(rect)
+
+        if self.background:
+            area = rect if rect else self.screen_rect
+            self.screen.blit(self.background, area, area)
+        else:
+            self.screen.fill(self.background_color, rect)
+
+        for _, surface, pos, _ in elements:
+            if rect is None or rect.colliderect(surface.get_rect(topleft=(int(pos[0]), int(pos[1])))):
+                self.screen.blit(surface, pos)
+
+        self.screen.set_clip(None)
@@ -0,0 +1,27 @@
+import pygame
+from typing import Dict, Optional, Tuple
+
+class FontRegistry:
+    def __init__(self):
+        self.fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+    
+    def get_font(self, path: Optional[str], size: int, fallback: str = "Arial") -> pygame.font.Font:
+        # path=None es la fuente por defecto de pygame, igual que pygame.font.Font(None, size)
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is not None:
+            return font
+        
+        try:
+            font = pygame.font.Font(path, size)
+        except Exception:
+            print(f"Info: Usando fuente por defecto ({fallback}) en lugar de {path}")
+            font = pygame.font.SysFont(fallback, size)
+        
+        self.fonts[key] = font
+        return font
+    
+    def clear(self):
+        self.fonts.clear()
+
+font_registry = FontRegistry()
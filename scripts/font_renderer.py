@@ -1,10 +1,22 @@
 import pygame
+import math
 import xml.etree.ElementTree as ET
-from typing import Dict, Tuple
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from .graphics_config import load_graphics_config
 
 class CustomFontRenderer:
     def __init__(self, xml_path: str, image_path: str):
         self.characters: Dict[str, Dict] = {}
+        
+        # Nivel 1: LRU de glifos ya recortados, escalados y tenidos por (char, scale, color)
+        # Nivel 2: LRU de textos completos por (text, scale, color, spacing)
+        config = load_graphics_config()
+        self.glyph_cache: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.text_cache: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.max_cached_glyphs = config.get("glyph_cache_size", 512)
+        self.max_cached_texts = config.get("text_cache_size", 128)
+        
         self.load_font(xml_path, image_path)
     
     def load_font(self, xml_path: str, image_path: str):
@@ -64,7 +76,31 @@ class CustomFontRenderer:
                    scale: float = 1.0, color: Tuple[int, int, int] = (255, 255, 255),
                    spacing: int = 0):
 
-        current_x = x
+        text_surface = self.get_text_surface(text, scale, color, spacing)
+        if text_surface is not None:
+            surface.blit(text_surface, (x, y))
+    
+    def get_text_surface(self, text: str, scale: float = 1.0,
+                         color: Tuple[int, int, int] = (255, 255, 255),
+                         spacing: int = 0) -> Optional[pygame.Surface]:
+        key = (text, scale, tuple(color), spacing)
+        text_surface = self.text_cache.get(key)
+        if text_surface is not None:
+            self.text_cache.move_to_end(key)
+            return text_surface
+        
+        text_surface = self.compose_text(text, scale, color, spacing)
+        if text_surface is not None:
+            self.text_cache[key] = text_surface
+            if len(self.text_cache) > self.max_cached_texts:
+                self.text_cache.popitem(last=False)
+        return text_surface
+    
+    def compose_text(self, text: str, scale: float, color: Tuple[int, int, int],
+                     spacing: int) -> Optional[pygame.Surface]:
+        glyphs = []
+        current_x = 0
+        height = 0
         
         for char in text:
             if char == ' ':
@@ -72,23 +108,48 @@ class CustomFontRenderer:
                 continue
                 
             if char in self.characters:
-                char_data = self.characters[char][0]
-                char_surface = pygame.Surface((char_data['width'], char_data['height']), pygame.SRCALPHA)
-                char_surface.blit(self.font_sheet, (0, 0), char_data['rect'])
-                
-                if scale != 1.0:
-                    new_width = int(char_data['width'] * scale)
-                    new_height = int(char_data['height'] * scale)
-                    char_surface = pygame.transform.scale(char_surface, (new_width, new_height))
-                
-                if color != (255, 255, 255):
-                    char_surface.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
-                
-                # Dibujar en la superficie principal
-                surface.blit(char_surface, (current_x, y))
-                current_x += char_data['width'] * scale + spacing
+                glyph = self.get_glyph(char, scale, color)
+                glyphs.append((glyph, current_x))
+                height = max(height, glyph.get_height())
+                current_x += self.characters[char][0]['width'] * scale + spacing
             else:
                 current_x += 20 * scale
+        
+        if not glyphs:
+            return None
+        
+        text_surface = pygame.Surface((max(1, math.ceil(current_x)), max(1, height)), pygame.SRCALPHA)
+        for glyph, glyph_x in glyphs:
+            text_surface.blit(glyph, (glyph_x, 0))
+        return text_surface
+    
+    def get_glyph(self, char: str, scale: float, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (char, scale, tuple(color))
+        glyph = self.glyph_cache.get(key)
+        if glyph is not None:
+            self.glyph_cache.move_to_end(key)
+            return glyph
+        
+        char_data = self.characters[char][0]
+        glyph = pygame.Surface((char_data['width'], char_data['height']), pygame.SRCALPHA)
+        glyph.blit(self.font_sheet, (0, 0), char_data['rect'])
+        
+        if scale != 1.0:
+            new_width = int(char_data['width'] * scale)
+            new_height = int(char_data['height'] * scale)
+            glyph = pygame.transform.scale(glyph, (new_width, new_height))
+        
+        if tuple(color) != (255, 255, 255):
+            glyph.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+        
+        self.glyph_cache[key] = glyph
+        if len(self.glyph_cache) > self.max_cached_glyphs:
+            self.glyph_cache.popitem(last=False)
+        return glyph
+    
+    def clear_cache(self):
+        self.glyph_cache.clear()
+        self.text_cache.clear()
     
     def get_text_width(self, text: str, scale: float = 1.0, spacing: int = 0) -> int:
         width = 0
@@ -0,0 +1,31 @@
+import os
+import json
+from typing import Dict
+
+CONFIG_PATH = "config/graphics_config.json"
+
+DEFAULT_CONFIG = {
+    "atlas_cache_budget_mb": 384,
+    "use_subsurface_frames": True,
+    "glyph_cache_size": 512,
+    "text_cache_size": 128,
+    "dirty_rect_rendering": False
+}
+
+_config_cache = None
+
+def load_graphics_config() -> Dict:
+    global _config_cache
+    if _config_cache is not None:
+        return _config_cache
+
+    config = dict(DEFAULT_CONFIG)
+    try:
+        if os.path.exists(CONFIG_PATH):
+            with open(CONFIG_PATH, 'r') as f:
+                config.update(json.load(f))
+    except Exception as e:
+        print(f"GraphicsConfig Error: {e}")
+
+    _config_cache = config
+    return config
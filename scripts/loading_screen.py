@@ -0,0 +1,62 @@
+import pygame
+import sys
+from .asset_preloader import asset_preloader
+from .audio_manager import AudioManager
+from .tween_scheduler import tween_scheduler
+
+class LoadingScreen:
+    def __init__(self, screen, manifest):
+        self.screen = screen
+        self.width, self.height = screen.get_size()
+        self.clock = pygame.time.Clock()
+        self.manifest = manifest
+
+        try:
+            self.background = pygame.image.load("assets/loading_page.png").convert()
+            self.background = pygame.transform.scale(self.background, (self.width, self.height))
+        except:
+            print("Error: No se pudo cargar loading_page")
+            self.background = None
+
+        self.bar_rect = pygame.Rect(self.width // 2 - 300, self.height - 60, 600, 16)
+        self.displayed_progress = 0.0
+
+    def handle_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                asset_preloader.shutdown()
+                AudioManager().cleanup()
+                pygame.quit()
+                sys.exit()
+
+    def update(self):
+        progress = asset_preloader.poll()
+        # Suavizado para que la barra no salte de golpe
+        self.displayed_progress += (progress - self.displayed_progress) * 0.3
+
+    def draw(self):
+        if self.background:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            self.screen.fill((0, 0, 0))
+
+        fill_rect = self.bar_rect.copy()
+        fill_rect.width = int(self.bar_rect.width * self.displayed_progress)
+        pygame.draw.rect(self.screen, (0, 0, 0), self.bar_rect)
+        pygame.draw.rect(self.screen, (255, 255, 255), fill_rect)
+        pygame.draw.rect(self.screen, (255, 255, 255), self.bar_rect, 2)
+
+        pygame.display.flip()
+
+    def run(self):
+        asset_preloader.reset_progress()
+        asset_preloader.start(self.manifest)
+
+        while not asset_preloader.is_done():
+            self.handle_events()
+            tween_scheduler.update()
+            self.update()
+            self.draw()
+            self.clock.tick(60)
+
+        asset_preloader.reset_progress()
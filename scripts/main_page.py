@@ -3,8 +3,19 @@ import sys
 from .sprite_loader import SpriteLoader, Animation
 from .audio_manager import AudioManager
 from .transition import Transition
+from .dirty_renderer import DirtyRectRenderer
+from .tween_scheduler import tween_scheduler
+from .mixer_service import PRIORITY_LOW
 
 class MainMenu:
+    preload_manifest = {
+        "atlases": [
+            ("assets/gfDanceTitle.xml", "assets/gfDanceTitle.png"),
+            ("assets/logoBumpin.xml", "assets/logoBumpin.png"),
+            ("assets/titleEnter.xml", "assets/titleEnter.png")
+        ]
+    }
+    
     def __init__(self, screen):
         self.screen = screen
         self.width, self.height = screen.get_size()
@@ -50,6 +61,7 @@ class MainMenu:
     
     def setup_elements(self):
         self.background_color = (0, 0, 0)
+        self.renderer = DirtyRectRenderer(self.screen, background_color=self.background_color)
         self.press_enter_alpha = 255
         self.press_enter_fading = True
     
@@ -78,9 +90,12 @@ class MainMenu:
                     pygame.quit()
                     sys.exit()
                 elif event.key in [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]:
-                    self.audio_manager.play_sound("scroll", volume=0.5)
+                    self.audio_manager.play_sound("scroll", volume=0.5, priority=PRIORITY_LOW)
         return None
     
+    def release_assets(self):
+        self.sprite_loader.release_all()
+    
     def transition_callback(self, next_screen):
         self.running = False
         self.next_screen = next_screen
@@ -104,46 +119,36 @@ class MainMenu:
         
         self.transition.update()
     
-    def draw(self):
-        self.screen.fill(self.background_color)
+    def get_draw_elements(self):
+        elements = []
         
         if hasattr(self, 'logo_animation'):
-            logo_frame = self.logo_animation.get_current_frame()
-            logo_surface = logo_frame['surface']
-            logo_scale = 0.9
-            logo_scaled = pygame.transform.scale(logo_surface, 
-                (int(logo_surface.get_width() * logo_scale), 
-                 int(logo_surface.get_height() * logo_scale)))
+            logo_scaled = self.logo_animation.get_scaled_frame(0.9)
             logo_x = 30
             logo_y = (self.height - logo_scaled.get_height()) // 2
-            self.screen.blit(logo_scaled, (logo_x, logo_y))
+            elements.append(("logo", logo_scaled, (logo_x, logo_y), None))
         
         if hasattr(self, 'gf_animation'):
-            gf_frame = self.gf_animation.get_current_frame()
-            gf_surface = gf_frame['surface']
-            gf_scale = 0.6
-            gf_scaled = pygame.transform.scale(gf_surface, 
-                (int(gf_surface.get_width() * gf_scale), 
-                 int(gf_surface.get_height() * gf_scale)))
+            gf_scaled = self.gf_animation.get_scaled_frame(0.6)
             gf_x = self.width - gf_scaled.get_width() - 30
             gf_y = (self.height - gf_scaled.get_height()) // 2
-            self.screen.blit(gf_scaled, (gf_x, gf_y))
+            elements.append(("gf", gf_scaled, (gf_x, gf_y), None))
         
         if hasattr(self, 'enter_animation'):
-            enter_frame = self.enter_animation.get_current_frame()
-            enter_surface = enter_frame['surface']
-            enter_scale = 0.4
-            enter_scaled = pygame.transform.scale(enter_surface, 
-                (int(enter_surface.get_width() * enter_scale), 
-                 int(enter_surface.get_height() * enter_scale)))
+            enter_scaled = self.enter_animation.get_scaled_frame(0.4)
             enter_x = (self.width - enter_scaled.get_width()) // 2
             enter_y = self.height - 150
             enter_scaled.set_alpha(self.press_enter_alpha)
-            self.screen.blit(enter_scaled, (enter_x, enter_y))
+            elements.append(("enter", enter_scaled, (enter_x, enter_y), (id(enter_scaled), self.press_enter_alpha)))
+        
+        return elements
+    
+    def draw(self):
+        self.renderer.draw(self.get_draw_elements(), force_full=self.transition.is_active())
         
         self.transition.draw()
         
-        pygame.display.flip()
+        self.renderer.present()
     
     def run(self):
         last_time = pygame.time.get_ticks()
@@ -158,6 +163,7 @@ class MainMenu:
             if result:
                 return result
             
+            tween_scheduler.update()
             self.update(dt)
             self.draw()
             self.clock.tick(60)
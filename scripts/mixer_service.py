@@ -0,0 +1,238 @@
+import pygame
+import os
+import json
+import time
+from typing import Dict, List, Optional
+
+CONFIG_PATH = "config/audio_config.json"
+FREQUENCY = 44100
+MIN_BUFFER = 256
+MAX_BUFFER = 4096
+DEFAULT_LATENCY_MS = 20
+DEFAULT_CHANNELS = 16
+
+# Prioridades de voz: una voz solo puede robar a otra de prioridad igual o menor
+PRIORITY_LOW = 0        # scroll de menus
+PRIORITY_NORMAL = 1     # confirm, back, etc.
+PRIORITY_HIGH = 2       # hit/miss del gameplay
+
+# Canales reservados para streams de cancion (las voces; el instrumental va
+# por pygame.mixer.music). El pool de voces usa los siguientes y
+# find_channel() nunca los devuelve
+STREAM_CHANNELS = 1
+
+def buffer_for_latency(latency_ms: float, frequency: int = FREQUENCY) -> int:
+    # Mayor potencia de dos cuyo buffer no supere la latencia pedida
+    target_frames = frequency * latency_ms / 1000.0
+    buffer = MIN_BUFFER
+    while buffer * 2 <= target_frames and buffer < MAX_BUFFER:
+        buffer *= 2
+    return buffer
+
+class Voice:
+    __slots__ = ("index", "channel", "id", "sound", "priority", "start_time", "loop", "volume", "pan")
+
+    def __init__(self, index: int, channel: pygame.mixer.Channel):
+        self.index = index
+        self.channel = channel
+        self.id = -1
+        self.sound = None
+        self.priority = PRIORITY_LOW
+        self.start_time = 0.0
+        self.loop = False
+        self.volume = 1.0
+        self.pan = 0.0
+
+class VoicePool:
+    """Tabla fija de voces, una por canal del mixer.
+
+    Las voces libres salen de una free list; cuando se acaba se reclaman
+    las que ya terminaron y, si todas siguen sonando, se roba la de menor
+    prioridad y mas vieja. El id lleva el indice en los bits bajos y una
+    generacion en los altos, asi nunca se repite y se resuelve en O(1).
+    """
+
+    INDEX_BITS = 8
+
+    def __init__(self, first_channel: int, channel_count: int):
+        self.voices = [Voice(i, pygame.mixer.Channel(first_channel + i)) for i in range(channel_count)]
+        self.free: List[int] = list(range(channel_count - 1, -1, -1))
+        self.generation = 0
+        self.steal_count = 0
+
+    def __len__(self):
+        return len(self.voices)
+
+    def play(self, sound: pygame.mixer.Sound, volume: float = 1.0, loops: int = 0,
+             priority: int = PRIORITY_NORMAL) -> Optional[Voice]:
+        voice = self._acquire(priority)
+        if voice is None:
+            return None
+
+        self.generation += 1
+        voice.id = (self.generation << self.INDEX_BITS) | voice.index
+        voice.sound = sound
+        voice.priority = priority
+        voice.start_time = time.perf_counter()
+        voice.loop = loops != 0
+        voice.volume = volume
+        voice.pan = 0.0
+
+        voice.channel.set_volume(volume)
+        voice.channel.play(sound, loops=loops)
+        return voice
+
+    def get(self, voice_id: int) -> Optional[Voice]:
+        if voice_id is None or voice_id < 0:
+            return None
+        index = voice_id & ((1 << self.INDEX_BITS) - 1)
+        if index >= len(self.voices):
+            return None
+        voice = self.voices[index]
+        return voice if voice.id == voice_id else None
+
+    def stop(self, voice_id: int):
+        voice = self.get(voice_id)
+        if voice:
+            voice.channel.stop()
+            self._release(voice)
+
+    def stop_all(self):
+        for voice in self.voices:
+            if voice.id != -1:
+                voice.channel.stop()
+                self._release(voice)
+
+    def get_active_voices(self) -> List[Voice]:
+        return [voice for voice in self.voices if voice.id != -1 and voice.channel.get_busy()]
+
+    def reclaim(self) -> int:
+        reclaimed = 0
+        for voice in self.voices:
+            if voice.id != -1 and not voice.channel.get_busy():
+                self._release(voice)
+                reclaimed += 1
+        return reclaimed
+
+    def _acquire(self, priority: int) -> Optional[Voice]:
+        if not self.free:
+            self.reclaim()
+        if self.free:
+            return self.voices[self.free.pop()]
+
+        # Todas suenan: se roba la de menor prioridad y, a igual prioridad, la mas vieja
+        victim = None
+        for voice in self.voices:
+            if voice.loop or voice.priority > priority:
+                continue
+            if victim is None or (voice.priority, voice.start_time) < (victim.priority, victim.start_time):
+                victim = voice
+        if victim is None:
+            return None
+
+        victim.channel.stop()
+        self.steal_count += 1
+        return victim
+
+    def _release(self, voice: Voice):
+        voice.id = -1
+        voice.sound = None
+        self.free.append(voice.index)
+
+class MixerService:
+    """Unico dueño de pygame.mixer.init.
+
+    El buffer sale de mixer_latency_ms y la cantidad de canales de
+    max_simultaneous_sounds (config/audio_config.json). Los AudioManager
+    del menu y de las semanas reproducen por su VoicePool, asi comparten
+    las mismas voces en vez de pelearse por la configuracion del mixer.
+    """
+
+    def __init__(self):
+        self.initialized = False
+        self.frequency = FREQUENCY
+        self.buffer_size = 0
+        self.channel_count = 0
+        self.latency_ms = DEFAULT_LATENCY_MS
+        self.voice_pool: Optional[VoicePool] = None
+
+    def load_config(self) -> Dict:
+        # mixer_latency_ms es la latencia objetivo del buffer del mixer;
+        # audio_latency es un valor aparte del usuario y no se toca aca
+        config = {"mixer_latency_ms": DEFAULT_LATENCY_MS, "max_simultaneous_sounds": DEFAULT_CHANNELS}
+        try:
+            if os.path.exists(CONFIG_PATH):
+                with open(CONFIG_PATH, 'r') as f:
+                    loaded = json.load(f)
+                for key in config:
+                    if key in loaded:
+                        config[key] = loaded[key]
+        except Exception as e:
+            print(f"MixerService Config Error: {e}")
+        return config
+
+    def init(self, latency_ms: Optional[float] = None, channels: Optional[int] = None) -> bool:
+        if self.initialized:
+            return True
+
+        config = self.load_config()
+        self.latency_ms = latency_ms if latency_ms is not None else config["mixer_latency_ms"]
+        self.buffer_size = buffer_for_latency(self.latency_ms, self.frequency)
+        channel_count = channels if channels is not None else config["max_simultaneous_sounds"]
+
+        try:
+            # pygame.init() ya pudo abrir el mixer con su buffer por defecto
+            if pygame.mixer.get_init():
+                pygame.mixer.quit()
+            pygame.mixer.init(frequency=self.frequency, size=-16, channels=2, buffer=self.buffer_size)
+        except pygame.error as e:
+            print(f"MixerService Error: {e}")
+            try:
+                pygame.mixer.init()
+            except pygame.error as e2:
+                print(f"MixerService Critical Error: {e2}")
+                return False
+
+        self.set_channel_count(channel_count)
+        self.initialized = True
+        print(f"MixerService: buffer {self.buffer_size} ({self.get_buffer_latency_ms():.1f} ms), "
+              f"{self.channel_count} canales")
+        return True
+
+    def is_ready(self) -> bool:
+        return self.initialized and pygame.mixer.get_init() is not None
+
+    def set_channel_count(self, count: int):
+        self.channel_count = max(1, int(count))
+        pygame.mixer.set_num_channels(STREAM_CHANNELS + self.channel_count)
+        pygame.mixer.set_reserved(STREAM_CHANNELS)
+        if self.voice_pool:
+            self.voice_pool.stop_all()
+        self.voice_pool = VoicePool(STREAM_CHANNELS, self.channel_count)
+
+    def get_stream_channel(self, index: int) -> Optional[pygame.mixer.Channel]:
+        if not self.is_ready() or not 0 <= index < STREAM_CHANNELS:
+            return None
+        return pygame.mixer.Channel(index)
+
+    def get_buffer_latency_ms(self) -> float:
+        return self.buffer_size / self.frequency * 1000.0
+
+    def play(self, sound: pygame.mixer.Sound, volume: float = 1.0, loops: int = 0,
+             priority: int = PRIORITY_NORMAL) -> Optional[Voice]:
+        if not self.is_ready():
+            return None
+        return self.voice_pool.play(sound, volume, loops, priority)
+
+    def get_voice(self, voice_id: int) -> Optional[Voice]:
+        return self.voice_pool.get(voice_id) if self.voice_pool else None
+
+    def stop(self, voice_id: int):
+        if self.voice_pool:
+            self.voice_pool.stop(voice_id)
+
+    def stop_all(self):
+        if self.voice_pool:
+            self.voice_pool.stop_all()
+
+mixer_service = MixerService()
@@ -4,8 +4,21 @@ import os
 from .sprite_loader import SpriteLoader, ButtonAnimation
 from .audio_manager import AudioManager
 from .transition import Transition
+from .asset_preloader import asset_preloader
+from .font_registry import font_registry
+from .dirty_renderer import DirtyRectRenderer
+from .tween_scheduler import tween_scheduler
+from .mixer_service import PRIORITY_LOW
 
 class SongSelection:
+    preload_manifest = {
+        "atlases": [
+            ("assets/freeplay.xml", "assets/freeplay.png"),
+            ("assets/credits.xml", "assets/credits.png")
+        ],
+        "images": ["assets/menuBG.png"]
+    }
+    
     def __init__(self, screen):
         self.screen = screen
         self.width, self.height = screen.get_size()
@@ -31,7 +44,7 @@ class SongSelection:
         )
         
         try:
-            self.background = pygame.image.load("assets/menuBG.png").convert()
+            self.background = asset_preloader.get_image("assets/menuBG.png")
             self.background = pygame.transform.scale(self.background, (self.width, self.height))
         except:
             print("Error: No se pudo cargar el fondo menuBG")
@@ -50,11 +63,11 @@ class SongSelection:
         ]
         self.selected_button = 0
         
-        try:
-            self.font = pygame.font.Font("fonts/vcr_osd_mono.ttf", 24)
-        except:
-            self.font = pygame.font.SysFont("Arial", 24)
-            print("Info: Usando fuente por defecto")
+        self.font = font_registry.get_font("fonts/vcr_osd_mono.ttf", 24, "Arial")
+        self.debug_text = self.font.render("(credits script missing here)", True, (255, 0, 0))
+        self.instructions_text = self.font.render("USE ARROWS TO SELECT - ENTER TO CONFIRM - ESC TO BACK", True, (255, 255, 255))
+        
+        self.renderer = DirtyRectRenderer(self.screen, background=self.background)
     
     def setup_audio(self):
 
@@ -85,13 +98,16 @@ class SongSelection:
                     self.audio_manager.play_sound("back", volume=0.7)
                     self.transition.start_fade_out(self.transition_callback, ("main_menu",))
                 elif event.key == pygame.K_UP and not self.transition.is_active():
-                    self.audio_manager.play_sound("scroll", volume=0.5)
+                    self.audio_manager.play_sound("scroll", volume=0.5, priority=PRIORITY_LOW)
                     self.selected_button = (self.selected_button - 1) % len(self.buttons)
                 elif event.key == pygame.K_DOWN and not self.transition.is_active():
-                    self.audio_manager.play_sound("scroll", volume=0.5)
+                    self.audio_manager.play_sound("scroll", volume=0.5, priority=PRIORITY_LOW)
                     self.selected_button = (self.selected_button + 1) % len(self.buttons)
         return None
     
+    def release_assets(self):
+        self.sprite_loader.release_all()
+    
     def transition_callback(self, next_screen):
         self.running = False
         self.next_screen = next_screen
@@ -116,60 +132,49 @@ class SongSelection:
         
         self.transition.update()
     
-    def draw(self):
-        if self.background:
-            self.screen.blit(self.background, (0, 0))
-        else:
-            self.screen.fill((0, 0, 0))
-        
+    def get_draw_elements(self):
+        elements = []
         button_y_start = self.height // 2 - 100
         
         if hasattr(self, 'freeplay_animation'):
-            freeplay_frame = self.freeplay_animation.get_current_frame()
-            if freeplay_frame:
-                freeplay_surface = freeplay_frame['surface']
-                freeplay_scale = 0.8
-                freeplay_scaled = pygame.transform.scale(freeplay_surface, 
-                    (int(freeplay_surface.get_width() * freeplay_scale), 
-                     int(freeplay_surface.get_height() * freeplay_scale)))
+            freeplay_scaled = self.freeplay_animation.get_scaled_frame(0.8)
+            if freeplay_scaled:
                 freeplay_x = (self.width - freeplay_scaled.get_width()) // 2
                 freeplay_y = button_y_start
-                self.screen.blit(freeplay_scaled, (freeplay_x, freeplay_y))
+                elements.append(("freeplay", freeplay_scaled, (freeplay_x, freeplay_y), None))
                 self.buttons[0]["x"] = freeplay_x
                 self.buttons[0]["y"] = freeplay_y
                 self.buttons[0]["width"] = freeplay_scaled.get_width()
                 self.buttons[0]["height"] = freeplay_scaled.get_height()
         
         if hasattr(self, 'credits_animation'):
-            credits_frame = self.credits_animation.get_current_frame()
-            if credits_frame:
-                credits_surface = credits_frame['surface']
-                credits_scale = 0.8
-                credits_scaled = pygame.transform.scale(credits_surface, 
-                    (int(credits_surface.get_width() * credits_scale), 
-                     int(credits_surface.get_height() * credits_scale)))
+            credits_scaled = self.credits_animation.get_scaled_frame(0.8)
+            if credits_scaled:
                 credits_x = (self.width - credits_scaled.get_width()) // 2
                 credits_y = button_y_start + 150
-                self.screen.blit(credits_scaled, (credits_x, credits_y))
+                elements.append(("credits", credits_scaled, (credits_x, credits_y), None))
                 self.buttons[1]["x"] = credits_x
                 self.buttons[1]["y"] = credits_y
                 self.buttons[1]["width"] = credits_scaled.get_width()
                 self.buttons[1]["height"] = credits_scaled.get_height()
         
         if self.selected_button == 1:
-            debug_text = self.font.render("(credits script missing here)", True, (255, 0, 0))
             debug_x = 50
             debug_y = 200
-            self.screen.blit(debug_text, (debug_x, debug_y))
+            elements.append(("debug_text", self.debug_text, (debug_x, debug_y), None))
         
-        instructions_text = self.font.render("USE ARROWS TO SELECT - ENTER TO CONFIRM - ESC TO BACK", True, (255, 255, 255))
-        instructions_x = (self.width - instructions_text.get_width()) // 2
+        instructions_x = (self.width - self.instructions_text.get_width()) // 2
         instructions_y = self.height - 100
-        self.screen.blit(instructions_text, (instructions_x, instructions_y))
+        elements.append(("instructions", self.instructions_text, (instructions_x, instructions_y), None))
+        
+        return elements
+    
+    def draw(self):
+        self.renderer.draw(self.get_draw_elements(), force_full=self.transition.is_active())
         
         self.transition.draw()
         
-        pygame.display.flip()
+        self.renderer.present()
     
     def run(self):
         last_time = pygame.time.get_ticks()
@@ -184,6 +189,7 @@ class SongSelection:
             if result:
                 return result
             
+            tween_scheduler.update()
             self.update(dt)
             self.draw()
             self.clock.tick(60)
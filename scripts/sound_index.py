@@ -0,0 +1,95 @@
+import pygame
+import os
+from typing import Dict, Iterable, Optional, Set
+
+SOUND_DIRECTORIES = ("audio/sfx", "assets/sounds", "sounds", ".")
+SOUND_EXTENSIONS = (".ogg",)
+
+class SoundIndex:
+    """Nombre de sonido -> archivo, armado una sola vez al arrancar.
+
+    scan() lista los directorios de sonidos (en el mismo orden de
+    prioridad que antes probaba _find_sound_file) y desde ahi buscar un
+    sonido es un lookup en un dict. Los nombres que no existen quedan en
+    missing, asi un 'hit' que falta no vuelve al disco ni imprime en cada
+    pulsacion. Los Sound ya decodificados (p.ej. por el AssetPreloader con
+    la clave "sounds" del manifest) se guardan en sounds.
+    """
+
+    def __init__(self, directories=SOUND_DIRECTORIES, extensions=SOUND_EXTENSIONS):
+        self.directories = directories
+        self.extensions = extensions
+        self.paths: Dict[str, str] = {}
+        self.missing: Set[str] = set()
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.scanned = False
+
+    def scan(self) -> int:
+        self.paths.clear()
+        self.missing.clear()
+
+        for directory in self.directories:
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+
+            for entry in sorted(entries, key=lambda e: e.name):
+                name, extension = os.path.splitext(entry.name)
+                if extension.lower() in self.extensions and entry.is_file() and name not in self.paths:
+                    path = entry.name if directory == "." else f"{directory}/{entry.name}"
+                    self.paths[name] = path
+
+        self.scanned = True
+        return len(self.paths)
+
+    def find(self, sound_name: str) -> Optional[str]:
+        if not self.scanned:
+            self.scan()
+        return self.paths.get(sound_name)
+
+    def get_sound(self, sound_name: str) -> Optional[pygame.mixer.Sound]:
+        sound = self.sounds.get(sound_name)
+        if sound is not None or sound_name in self.missing:
+            return sound
+
+        path = self.find(sound_name)
+        if path is None:
+            print(f"SoundIndex: Sound file not found: {sound_name}")
+            self.missing.add(sound_name)
+            return None
+
+        try:
+            sound = pygame.mixer.Sound(path)
+        except pygame.error as e:
+            print(f"SoundIndex: Error loading sound {sound_name}: {e}")
+            self.missing.add(sound_name)
+            return None
+
+        self.sounds[sound_name] = sound
+        return sound
+
+    def store(self, sound_name: str, sound: pygame.mixer.Sound):
+        self.sounds[sound_name] = sound
+        self.missing.discard(sound_name)
+
+    def is_loaded(self, sound_name: str) -> bool:
+        return sound_name in self.sounds or sound_name in self.missing
+
+    def get_missing_paths(self, sound_names: Iterable[str]) -> Dict[str, str]:
+        # Nombres del manifest que todavia hay que decodificar, con su archivo
+        jobs = {}
+        for sound_name in sound_names:
+            if self.is_loaded(sound_name):
+                continue
+            path = self.find(sound_name)
+            if path is None:
+                self.missing.add(sound_name)
+            else:
+                jobs[sound_name] = path
+        return jobs
+
+    def clear(self):
+        self.sounds.clear()
+
+sound_index = SoundIndex()
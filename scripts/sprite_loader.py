@@ -1,53 +1,28 @@
 import pygame
-import xml.etree.ElementTree as ET
-import os
+from .atlas_cache import atlas_cache
 
 class SpriteLoader:
     def __init__(self):
         self.sprites = {}
     
     def load_sprite_sheet(self, xml_path, image_path):
-        try:
-            if not os.path.exists(image_path):
-                print(f"Error: No se encuentra la imagen {image_path}")
-                return None
-                
-            sheet_image = pygame.image.load(image_path).convert_alpha()
-            
-            if not os.path.exists(xml_path):
-                print(f"Error: No se encuentra el XML {xml_path}")
-                return None
-                
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-            
-            frames = []
-            for subtexture in root.findall('SubTexture'):
-                frame_data = {
-                    'name': subtexture.get('name'),
-                    'x': int(subtexture.get('x')),
-                    'y': int(subtexture.get('y')),
-                    'width': int(subtexture.get('width')),
-                    'height': int(subtexture.get('height')),
-                    'frameX': int(subtexture.get('frameX', 0)),
-                    'frameY': int(subtexture.get('frameY', 0)),
-                    'frameWidth': int(subtexture.get('frameWidth', int(subtexture.get('width')))),
-                    'frameHeight': int(subtexture.get('frameHeight', int(subtexture.get('height'))))
-                }
-                
-                frame_surface = pygame.Surface((frame_data['width'], frame_data['height']), pygame.SRCALPHA)
-                frame_surface.blit(sheet_image, (0, 0), 
-                                 (frame_data['x'], frame_data['y'], 
-                                  frame_data['width'], frame_data['height']))
-                
-                frame_data['surface'] = frame_surface
-                frames.append(frame_data)
-            
-            return frames
-            
-        except Exception as e:
-            print(f"Error cargando spritesheet: {e}")
-            return None
+        key = (xml_path, image_path)
+        if key in self.sprites:
+            return self.sprites[key]
+        
+        frames = atlas_cache.acquire(xml_path, image_path)
+        if frames is not None:
+            self.sprites[key] = frames
+        return frames
+    
+    def release_all(self):
+        for xml_path, image_path in self.sprites:
+            atlas_cache.release(xml_path, image_path)
+        self.sprites.clear()
+    
+    def __del__(self):
+        self.release_all()
+
 class Animation:
     def __init__(self, frames, fps=12):
         self.frames = frames
@@ -55,6 +30,7 @@ class Animation:
         self.current_frame = 0
         self.animation_time = 0
         self.frame_duration = 1000 / fps
+        self.scaled_frames = {}
     
     def update(self, dt):
         self.animation_time += dt
@@ -62,8 +38,27 @@ class Animation:
             self.animation_time = 0
             self.current_frame = (self.current_frame + 1) % len(self.frames)
     
+    def reset(self):
+        self.current_frame = 0
+        self.animation_time = 0
+    
     def get_current_frame(self):
         return self.frames[self.current_frame]
+    
+    def get_scaled_frame(self, scale):
+        frame = self.get_current_frame()
+        if frame is None:
+            return None
+        
+        surface = frame['surface']
+        size = (int(surface.get_width() * scale), int(surface.get_height() * scale))
+        key = (id(frame), size)
+        
+        scaled_surface = self.scaled_frames.get(key)
+        if scaled_surface is None:
+            scaled_surface = pygame.transform.scale(surface, size)
+            self.scaled_frames[key] = scaled_surface
+        return scaled_surface
 
 class ButtonAnimation:
     def __init__(self, frames, fps=12):
@@ -75,6 +70,7 @@ class ButtonAnimation:
         self.animation_time = 0
         self.frame_duration = 1000 / fps
         self.state = "idle"
+        self.scaled_frames = {}
     
     def set_state(self, state):
         if state != self.state:
@@ -102,4 +98,19 @@ class ButtonAnimation:
                 return self.all_frames[0]
             return None
             
-        return current_frames[self.current_frame]
\ No newline at end of file
+        return current_frames[self.current_frame]
+    
+    def get_scaled_frame(self, scale):
+        frame = self.get_current_frame()
+        if frame is None:
+            return None
+        
+        surface = frame['surface']
+        size = (int(surface.get_width() * scale), int(surface.get_height() * scale))
+        key = (id(frame), size)
+        
+        scaled_surface = self.scaled_frames.get(key)
+        if scaled_surface is None:
+            scaled_surface = pygame.transform.scale(surface, size)
+            self.scaled_frames[key] = scaled_surface
+        return scaled_surface
\ No newline at end of file
@@ -0,0 +1,108 @@
+import time
+from typing import Callable, List, Optional
+
+def linear(t: float) -> float:
+    return t
+
+def ease_in_quad(t: float) -> float:
+    return t * t
+
+def ease_out_quad(t: float) -> float:
+    return t * (2 - t)
+
+def ease_in_out_quad(t: float) -> float:
+    return 2 * t * t if t < 0.5 else -1 + (4 - 2 * t) * t
+
+class Tween:
+    def __init__(self, setter: Callable[[float], None], start: float, end: float, duration: float,
+                 easing: Callable[[float], float] = linear, on_complete: Optional[Callable[[], None]] = None,
+                 tag: Optional[str] = None):
+        self.setter = setter
+        self.start = start
+        self.end = end
+        self.duration = max(0.0, duration)
+        self.easing = easing
+        self.on_complete = on_complete
+        self.tag = tag
+        self.elapsed = 0.0
+        self.finished = False
+        self.cancelled = False
+
+    def step(self, dt: float):
+        self.elapsed += dt
+        progress = 1.0 if self.duration == 0 else min(1.0, self.elapsed / self.duration)
+        self.setter(self.start + (self.end - self.start) * self.easing(progress))
+        if progress >= 1.0:
+            self.finished = True
+
+class TweenScheduler:
+    """Tweens avanzados desde el loop principal, sin hilos.
+
+    Las pantallas llaman a update() una vez por frame. Sin dt, el tiempo se
+    mide con perf_counter desde el update anterior, asi que llamarlo desde
+    mas de un lugar en el mismo frame no acelera nada. Las duraciones son en
+    milisegundos, como en el resto del audio.
+    """
+
+    def __init__(self):
+        self.tweens: List[Tween] = []
+        self.last_update = None
+
+    def tween(self, setter: Callable[[float], None], start: float, end: float, duration: float,
+              easing: Callable[[float], float] = linear, on_complete: Optional[Callable[[], None]] = None,
+              tag: Optional[str] = None) -> Tween:
+        tween = Tween(setter, start, end, duration, easing, on_complete, tag)
+        setter(start)
+        self.tweens.append(tween)
+        if self.last_update is None:
+            self.last_update = time.perf_counter()
+        return tween
+
+    def tween_property(self, target, attribute: str, end: float, duration: float,
+                       easing: Callable[[float], float] = linear,
+                       on_complete: Optional[Callable[[], None]] = None, tag: Optional[str] = None) -> Tween:
+        return self.tween(lambda value: setattr(target, attribute, value), getattr(target, attribute),
+                          end, duration, easing, on_complete, tag)
+
+    def cancel(self, tween: Tween):
+        tween.cancelled = True
+
+    def cancel_tag(self, tag: str):
+        for tween in self.tweens:
+            if tween.tag == tag:
+                tween.cancelled = True
+
+    def is_active(self, tag: Optional[str] = None) -> bool:
+        return any(not tween.cancelled and not tween.finished and (tag is None or tween.tag == tag)
+                   for tween in self.tweens)
+
+    def update(self, dt: Optional[float] = None):
+        now = time.perf_counter()
+        if dt is None:
+            dt = 0.0 if self.last_update is None else (now - self.last_update) * 1000
+        self.last_update = now
+
+        if not self.tweens:
+            return
+
+        # on_complete puede crear tweens nuevos: se procesan desde el proximo frame
+        current = self.tweens
+        self.tweens = []
+        for tween in current:
+            if tween.cancelled:
+                continue
+            try:
+                tween.step(dt)
+            except Exception as e:
+                print(f"TweenScheduler: Error en tween {tween.tag}: {e}")
+                continue
+
+            if not tween.finished:
+                self.tweens.append(tween)
+            elif tween.on_complete and not tween.cancelled:
+                tween.on_complete()
+
+    def clear(self):
+        self.tweens.clear()
+
+tween_scheduler = TweenScheduler()
@@ -1,6 +1,8 @@
 import pygame
 import os
 from enum import Enum
+from scripts.mixer_service import mixer_service, PRIORITY_HIGH
+from scripts.sound_index import sound_index
 
 class MusicState(Enum):
     STOPPED = 0
@@ -9,28 +11,30 @@ class MusicState(Enum):
 
 class AudioManager:
     def __init__(self):
-        if not pygame.mixer.get_init():
-            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        # Mismo mixer y mismos canales que el AudioManager del menu
+        mixer_service.init()
         
         self.current_music = None
         self.music_volume = 0.7
         self.sound_volume = 0.8
         self.music_state = MusicState.STOPPED
+        self.music_loop = -1
         self.loaded_sounds = {}
         
         pygame.mixer.music.set_volume(self.music_volume)
         
-    def play_music(self, filepath, loop=-1, fade_in=0):
+    def play_music(self, filepath, loop=-1, fade_in=0, start=0.0):
         try:
             if os.path.exists(filepath):
                 if self.current_music != filepath:
                     pygame.mixer.music.load(filepath)
                     self.current_music = filepath
+                self.music_loop = loop
                 
                 if fade_in > 0:
-                    pygame.mixer.music.play(loop, fade_ms=fade_in)
+                    pygame.mixer.music.play(loop, start, fade_ms=fade_in)
                 else:
-                    pygame.mixer.music.play(loop)
+                    pygame.mixer.music.play(loop, start)
                 
                 self.music_state = MusicState.PLAYING
                 print(f"Reproduciendo música: {filepath}")
@@ -57,6 +61,19 @@ class AudioManager:
         except Exception as e:
             print(f"Error deteniendo música: {e}")
     
+    def seek_music(self, position):
+        # play(start=) reinicia get_pos() en 0: el Conductor suma la posicion
+        # de arranque con start(position)
+        if not self.current_music:
+            return False
+        try:
+            pygame.mixer.music.play(self.music_loop, start=position)
+            self.music_state = MusicState.PLAYING
+            return True
+        except Exception as e:
+            print(f"Error buscando posicion {position:.2f}s: {e}")
+            return False
+    
     def pause_music(self):
         try:
             pygame.mixer.music.pause()
@@ -76,16 +93,15 @@ class AudioManager:
         pygame.mixer.music.set_volume(self.music_volume)
     
     def set_sound_volume(self, volume):
+        # El volumen se aplica por canal en play_sound: los Sound pueden
+        # ser compartidos con el menu a traves de sound_index
         self.sound_volume = max(0.0, min(1.0, volume))
-        for sound in self.loaded_sounds.values():
-            sound.set_volume(self.sound_volume)
     
     def preload_sounds(self, sound_dict):
         for key, filepath in sound_dict.items():
             try:
                 if os.path.exists(filepath):
                     sound = pygame.mixer.Sound(filepath)
-                    sound.set_volume(self.sound_volume)
                     self.loaded_sounds[key] = sound
                     print(f"Sonido preload: {key} -> {filepath}")
                 else:
@@ -94,26 +110,38 @@ class AudioManager:
             except Exception as e:
                 print(f"Error cargando sonido {filepath}: {e}")
     
-    def play_sound(self, sound_key, volume=None):
+    def play_sound(self, sound_key, volume=None, priority=PRIORITY_HIGH):
         try:
-            if sound_key in self.loaded_sounds:
-                sound = self.loaded_sounds[sound_key]
-                if volume is not None:
-                    original_volume = sound.get_volume()
-                    sound.set_volume(min(volume, self.sound_volume))
-                    sound.play()
-                    sound.set_volume(original_volume)
-                else:
-                    sound.play()
-                return True
-            else:
-                print(f"Sonido no encontrado: {sound_key}")
-                return False
+            sound = self.loaded_sounds.get(sound_key)
+            if sound is None:
+                # Sin preload explicito se busca en el indice; un sonido que
+                # no existe se reporta una sola vez y no vuelve a tocar disco
+                sound = sound_index.get_sound(sound_key)
+                if sound is None:
+                    return False
+                self.loaded_sounds[sound_key] = sound
+            
+            # El volumen por reproduccion va en el canal: cambiar el del
+            # Sound tambien afectaria a las copias que ya suenan
+            channel_volume = self.sound_volume if volume is None else min(volume, self.sound_volume)
+            return mixer_service.play(sound, channel_volume, priority=priority) is not None
                 
         except Exception as e:
             print(f"Error reproduciendo sonido {sound_key}: {e}")
             return False
     
+    def get_music_position(self):
+        # Segundos desde play(); None si no hay musica sonando
+        if self.music_state != MusicState.PLAYING:
+            return None
+        try:
+            position = pygame.mixer.music.get_pos()
+        except Exception:
+            return None
+        if position < 0:
+            return None
+        return position / 1000.0
+    
     def get_current_music(self):
 
         return self.current_music
@@ -1,29 +1,54 @@
 import pygame
 import os
+from collections import deque
 from .audio_manager import week_audio_manager
+from .conductor import Conductor
+from .replay import ReplayPlayer
+from .song_player import SongPlayer
 from .note_renderer import note_renderer
+from scripts.font_registry import font_registry
+from scripts.tween_scheduler import tween_scheduler
 
 class BaseWeek:
+    preload_manifest = {
+        "atlases": [("assets/NOTE_assets.xml", "assets/NOTE_assets.png")],
+        "sounds": ["hit", "miss"]
+    }
+    
+    LANE_KEYS = {
+        pygame.K_LEFT: 0,
+        pygame.K_DOWN: 1,
+        pygame.K_UP: 2,
+        pygame.K_RIGHT: 3
+    }
+    
     def __init__(self, screen):
         self.screen = screen
         self.width, self.height = screen.get_size()
         self.running = True
-        self.score = 0
-        self.health = 100
-        self.combo = 0
-        self.max_combo = 0
-        self.notes_hit = 0
-        self.notes_missed = 0
-        self.accuracy = 100.0
+        self.reset_stats()
         
         self.audio_manager = week_audio_manager
         
         self.note_renderer = note_renderer
+        self.note_renderer.ensure_loaded()
+        self.song = None
         self.notes = []
         self.active_notes = []
+        # Notas ya golpeadas que muestran su animacion de confirmacion
+        self.confirm_notes = []
+        # Una cola por carril con las notas del jugador ordenadas por tiempo
+        self.lane_queues = [deque() for _ in range(4)]
+        self.hit_window = 0.2
         
-        self.song_start_time = 0
+        self.conductor = Conductor(self.audio_manager)
         self.current_song_time = 0
+        # Instrumental + voces en canales dedicados (ver load_song_audio)
+        self.song_player = None
+        
+        # Grabacion/reproduccion de input (ReplayRecorder / ReplayPlayer)
+        self.replay_recorder = None
+        self.replay_player = None
         self.song_playing = False
         
         self.game_state = "playing"  # playing, paused, game_over, completed
@@ -39,6 +64,19 @@ class BaseWeek:
         """Configurar stage y posiciones - debe ser implementado por cada semana"""
         raise NotImplementedError("Cada semana debe implementar setup_stage()")
     
+    def load_song_audio(self, instrumental_path, vocals_path=None):
+        if self.song_player:
+            self.song_player.stop()
+        if self.song and not self.song.needs_voicing:
+            vocals_path = None
+        
+        # El instrumental sale por self.audio_manager, asi que el Conductor
+        # sigue guiado por la posicion que reporta el mixer
+        self.song_player = SongPlayer(self.audio_manager, instrumental_path, vocals_path)
+        if not self.song_player.is_loaded():
+            self.song_player = None
+        return self.song_player is not None
+    
     def load_song_data(self):
         raise NotImplementedError("Cada semana debe implementar load_song_data()")
     
@@ -49,35 +87,76 @@ class BaseWeek:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.toggle_pause()
-                elif self.game_state == "playing":
+                elif self.game_state == "playing" and not self.replay_player:
                     # Manejar flechas del jugador
-                    if event.key == pygame.K_LEFT:
-                        self.handle_note_input(0)
-                    elif event.key == pygame.K_DOWN:
-                        self.handle_note_input(1)
-                    elif event.key == pygame.K_UP:
-                        self.handle_note_input(2)
-                    elif event.key == pygame.K_RIGHT:
-                        self.handle_note_input(3)
+                    direction = self.LANE_KEYS.get(event.key)
+                    if direction is not None:
+                        self.press_lane(direction)
+            elif event.type == pygame.KEYUP:
+                if self.game_state == "playing" and not self.replay_player:
+                    direction = self.LANE_KEYS.get(event.key)
+                    if direction is not None:
+                        self.release_lane(direction)
         
         return None
     
+    def press_lane(self, direction):
+        if self.replay_recorder:
+            self.replay_recorder.record(self.get_current_song_time(), direction, True)
+        self.handle_note_input(direction)
+    
+    def release_lane(self, direction):
+        if self.replay_recorder:
+            self.replay_recorder.record(self.get_current_song_time(), direction, False)
+        self.handle_note_release(direction)
+    
+    def handle_note_release(self, direction):
+        pass
+    
+    def set_replay(self, replay):
+        self.replay_player = ReplayPlayer(replay) if replay else None
+    
+    def update_replay(self):
+        # Cada evento se juzga con su tiempo grabado, no con el del frame,
+        # asi el resultado es el mismo a cualquier framerate
+        frame_time = self.current_song_time
+        for event_time, direction, pressed in self.replay_player.poll(frame_time):
+            self.current_song_time = event_time
+            if pressed:
+                self.press_lane(direction)
+            else:
+                self.release_lane(direction)
+        self.current_song_time = frame_time
+    
     def handle_note_input(self, direction):
         current_time = self.get_current_song_time()
         
-        best_note = None
-        best_time_diff = 0.2 
+        queue = self.lane_queues[direction]
+        while queue and not queue[0].active:
+            queue.popleft()
         
-        for note in self.active_notes:
-            if note.direction == direction and note.must_hit and note.active:
-                time_diff = abs(note.time - current_time)
-                if time_diff < best_time_diff:
-                    best_time_diff = time_diff
-                    best_note = note
+        # Solo se compara la cabeza del carril y la siguiente (jacks)
+        best_note = None
+        best_position = 0
+        best_time_diff = self.hit_window
+        for position in range(min(2, len(queue))):
+            note = queue[position]
+            time_diff = abs(note.time - current_time)
+            if note.active and time_diff < best_time_diff:
+                best_time_diff = time_diff
+                best_note = note
+                best_position = position
         
         if best_note:
             result = best_note.check_hit(current_time)
             if result:
+                if self.song_player:
+                    self.song_player.set_vocals_muted(False)
+                # Sale del carril ya mismo: el objeto puede volver al pool
+                # antes de llegar al frente de la cola
+                del queue[best_position]
+                self.active_notes.remove(best_note)
+                self.confirm_notes.append(best_note)
                 self.on_note_hit(best_note, result)
                 self.audio_manager.play_sound("hit", volume=0.7)
         else:
@@ -85,9 +164,6 @@ class BaseWeek:
             self.audio_manager.play_sound("miss", volume=0.5)
     
     def on_note_hit(self, note, result):
-        note.hit = True
-        note.active = False
-        
         if result == "perfect":
             self.score += 350
             self.combo += 1
@@ -108,6 +184,8 @@ class BaseWeek:
         self.on_note_hit_animation(note.direction)
     
     def on_note_miss(self, direction):
+        if self.song_player:
+            self.song_player.set_vocals_muted(True)
         self.combo = 0
         self.notes_missed += 1
         self.health = max(0, self.health - 10)
@@ -128,34 +206,97 @@ class BaseWeek:
     def on_note_miss_animation(self, direction):
         pass
     
+    def update_animations(self, dt):
+        pass
+    
     def toggle_pause(self):
         if self.game_state == "playing":
             self.game_state = "paused"
             self.audio_manager.pause_music()
+            if self.song_player:
+                self.song_player.pause()
+            self.conductor.pause()
         elif self.game_state == "paused":
             self.game_state = "playing"
             self.audio_manager.resume_music()
+            if self.song_player:
+                self.song_player.resume()
+            self.conductor.resume()
     
     def get_current_song_time(self):
         if self.song_playing:
             return self.current_song_time
         return 0
     
+    def reset_stats(self):
+        self.score = 0
+        self.health = 100
+        self.combo = 0
+        self.max_combo = 0
+        self.notes_hit = 0
+        self.notes_missed = 0
+        self.accuracy = 100.0
+    
+    def restart_song(self):
+        # Las notas vivas salen de active_notes y de los carriles antes de
+        # que Song.start() las devuelva al pool para reusarlas
+        self.clear_active_notes()
+        if self.song:
+            self.song.start()
+        self.reset_stats()
+        self.game_state = "playing"
+        self.start_song()
+    
     def start_song(self):
-        self.song_start_time = pygame.time.get_ticks() / 1000.0
+        # Nunca quedan notas de una corrida anterior apuntando a objetos del pool
+        self.clear_active_notes()
+        self.conductor.set_song(self.song)
+        self.conductor.start()
+        if self.replay_recorder:
+            self.replay_recorder.reset(self.song.name if self.song else "")
+        if self.replay_player:
+            self.replay_player.reset()
         self.song_playing = True
-        self.audio_manager.resume_music()
+        if self.song_player:
+            self.song_player.play()
+        else:
+            self.audio_manager.resume_music()
+    
+    def seek_song(self, time):
+        # Salto de practica: las notas vivas salen de la semana antes de que
+        # Song.seek las devuelva al pool y rearme las filas desde 'time'
+        self.clear_active_notes()
+        if self.song:
+            self.song.seek(time)
+        self.current_song_time = time
+        self.conductor.start(time)
+        if self.song_player:
+            self.song_player.play(time)
+        else:
+            self.audio_manager.seek_music(time)
+        
+        if self.game_state == "paused":
+            self.conductor.pause()
+            if self.song_player:
+                self.song_player.pause()
+            self.audio_manager.pause_music()
     
     def stop_song(self):
         self.song_playing = False
+        self.conductor.stop()
+        if self.song_player:
+            self.song_player.stop()
         self.audio_manager.stop_music()
     
     def update(self, dt):
+        tween_scheduler.update()
         if self.game_state != "playing":
             return
         
         if self.song_playing:
-            self.current_song_time = (pygame.time.get_ticks() / 1000.0) - self.song_start_time
+            self.current_song_time = self.conductor.update()
+            if self.replay_player:
+                self.update_replay()
         
         self.update_notes(dt)
         
@@ -166,16 +307,63 @@ class BaseWeek:
     def update_notes(self, dt):
         current_time = self.get_current_song_time()
         
-        for note in self.active_notes[:]:
-            note.update(dt, self.get_note_target_y(), current_time)
-
-            if not note.active and not note.showing_confirm:
-                self.active_notes.remove(note)
+        # Solo las notas golpeadas se recorren una por una (animacion)
+        if self.confirm_notes:
+            still_confirming = []
+            for note in self.confirm_notes:
+                if note.update_confirm(dt):
+                    still_confirming.append(note)
+                elif self.song:
+                    self.song.despawn(note)
+            self.confirm_notes = still_confirming
         
         self.spawn_notes(current_time)
+        
+        if self.song and self.active_notes:
+            # y/alpha/scale y deteccion de fallos de todas las notas vivas en
+            # una sola pasada vectorizada
+            first_index = self.active_notes[0].index
+            last_index = self.active_notes[-1].index + 1
+            passed_rows = self.song.chart.update_window(first_index, last_index, current_time,
+                                                        self.get_note_target_y(), self.song.speed)
+            if len(passed_rows):
+                self.remove_passed_notes(passed_rows)
+    
+    def remove_passed_notes(self, rows):
+        if self.song_player and self.song.chart.must_hit[rows].any():
+            # Nota del jugador que paso sin golpear: se callan las voces
+            self.song_player.set_vocals_muted(True)
+        
+        self.active_notes = [note for note in self.active_notes if note.active]
+        for row in rows:
+            note = self.song.spawned_notes.get(int(row))
+            if note:
+                self.song.despawn(note)
+        
+        # Las notas vencidas salen por el frente de su carril
+        for queue in self.lane_queues:
+            while queue and not queue[0].active:
+                queue.popleft()
     
     def spawn_notes(self, current_time):
-        pass
+        if self.song:
+            self.song.current_time = current_time
+            for note in self.song.get_notes_for_spawning():
+                self.add_active_note(note)
+    
+    def add_active_note(self, note):
+        self.active_notes.append(note)
+        if note.must_hit:
+            self.lane_queues[note.direction].append(note)
+    
+    def clear_active_notes(self):
+        if self.song:
+            for note in self.active_notes + self.confirm_notes:
+                self.song.despawn(note)
+        self.active_notes = []
+        self.confirm_notes = []
+        for queue in self.lane_queues:
+            queue.clear()
     
     def get_note_target_y(self):
         return self.height - 200
@@ -189,14 +377,9 @@ class BaseWeek:
     def is_song_completed(self):
         return False
     
-        pass
-    
-
-        pass
-    
     def draw_hud(self):
 
-        score_font = pygame.font.Font(None, 36)
+        score_font = font_registry.get_font(None, 36)
         score_text = score_font.render(f"Score: {self.score}", True, (255, 255, 255))
         self.screen.blit(score_text, (20, 20))
         
@@ -226,7 +409,7 @@ class BaseWeek:
         pygame.draw.rect(self.screen, health_color, health_rect)
         pygame.draw.rect(self.screen, (255, 255, 255), health_border, 2)
     
-        health_font = pygame.font.Font(None, 24)
+        health_font = font_registry.get_font(None, 24)
         health_text = health_font.render(f"Health: {int(self.health)}%", True, (255, 255, 255))
         self.screen.blit(health_text, (self.width // 2 - 40, 35))
     
@@ -235,12 +418,12 @@ class BaseWeek:
         overlay.fill((0, 0, 0, 150))
         self.screen.blit(overlay, (0, 0))
         
-        pause_font = pygame.font.Font(None, 72)
+        pause_font = font_registry.get_font(None, 72)
         pause_text = pause_font.render("PAUSED", True, (255, 255, 255))
         text_rect = pause_text.get_rect(center=(self.width // 2, self.height // 2))
         self.screen.blit(pause_text, text_rect)
         
-        instruction_font = pygame.font.Font(None, 36)
+        instruction_font = font_registry.get_font(None, 36)
         instruction_text = instruction_font.render("Press ESC to resume", True, (200, 200, 200))
         instruction_rect = instruction_text.get_rect(center=(self.width // 2, self.height // 2 + 60))
         self.screen.blit(instruction_text, instruction_rect)
@@ -251,17 +434,17 @@ class BaseWeek:
         overlay.fill((0, 0, 0, 200))
         self.screen.blit(overlay, (0, 0))
         
-        game_over_font = pygame.font.Font(None, 72)
+        game_over_font = font_registry.get_font(None, 72)
         game_over_text = game_over_font.render("GAME OVER", True, (255, 0, 0))
         text_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
         self.screen.blit(game_over_text, text_rect)
         
-        stats_font = pygame.font.Font(None, 36)
+        stats_font = font_registry.get_font(None, 36)
         stats_text = stats_font.render(f"Final Score: {self.score} | Max Combo: {self.max_combo}", True, (255, 255, 255))
         stats_rect = stats_text.get_rect(center=(self.width // 2, self.height // 2 + 20))
         self.screen.blit(stats_text, stats_rect)
         
-        instruction_font = pygame.font.Font(None, 24)
+        instruction_font = font_registry.get_font(None, 24)
         instruction_text = instruction_font.render("Press ESC to return to menu", True, (200, 200, 200))
         instruction_rect = instruction_text.get_rect(center=(self.width // 2, self.height // 2 + 80))
         self.screen.blit(instruction_text, instruction_rect)
@@ -271,18 +454,18 @@ class BaseWeek:
         overlay.fill((0, 0, 0, 150))
         self.screen.blit(overlay, (0, 0))
         
-        complete_font = pygame.font.Font(None, 72)
+        complete_font = font_registry.get_font(None, 72)
         complete_text = complete_font.render("SONG COMPLETED!", True, (0, 255, 0))
         text_rect = complete_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
         self.screen.blit(complete_text, text_rect)
         
-        stats_font = pygame.font.Font(None, 36)
+        stats_font = font_registry.get_font(None, 36)
         stats_text = stats_font.render(f"Score: {self.score} | Accuracy: {self.accuracy:.1f}% | Max Combo: {self.max_combo}", True, (255, 255, 255))
         stats_rect = stats_text.get_rect(center=(self.width // 2, self.height // 2 + 20))
         self.screen.blit(stats_text, stats_rect)
         
         rating = self.calculate_rating()
-        rating_font = pygame.font.Font(None, 48)
+        rating_font = font_registry.get_font(None, 48)
         rating_text = rating_font.render(f"Rating: {rating}", True, (255, 215, 0))
         rating_rect = rating_text.get_rect(center=(self.width // 2, self.height // 2 + 70))
         self.screen.blit(rating_text, rating_rect)
@@ -300,6 +483,8 @@ class BaseWeek:
             return "D"
     
     def cleanup(self):
+        if self.song_player:
+            self.song_player.stop()
         self.audio_manager.stop_music()
         self.audio_manager.cleanup()
     
@@ -130,9 +130,6 @@ class Character:
                     original_size = self.current_frame.get_size()
                     new_size = (int(original_size[0] * self.scale), int(original_size[1] * self.scale))
                     self.current_frame = pygame.transform.scale(self.current_frame, new_size)
-                
-                if self.alpha < 255:
-                    self.current_frame.set_alpha(self.alpha)
     
     def draw(self, screen, x=None, y=None):
         if self.current_frame:
@@ -144,7 +141,15 @@ class Character:
             draw_x -= rect.width // 2
             draw_y -= rect.height // 2
             
-            screen.blit(self.current_frame, (draw_x, draw_y))
+            if self.alpha < 255:
+                # El frame puede ser la vista compartida del atlas: el alpha
+                # se pone solo mientras dura el blit, sin copiar el frame
+                previous_alpha = self.current_frame.get_alpha()
+                self.current_frame.set_alpha(self.alpha)
+                screen.blit(self.current_frame, (draw_x, draw_y))
+                self.current_frame.set_alpha(previous_alpha)
+            else:
+                screen.blit(self.current_frame, (draw_x, draw_y))
     
     def get_animation_names(self):
         return list(self.animations.keys())
@@ -0,0 +1,91 @@
+import json
+import mmap
+import os
+import struct
+import numpy as np
+from .chart_store import ChartStore
+
+# Formato .fnfchart (little endian):
+#   cabecera  -> magic, version, mtime_ns y tamano del JSON de origen,
+#                numero de notas, bytes de metadatos
+#   metadatos -> nombre, bpm y secciones sin sectionNotes (JSON UTF-8,
+#                relleno hasta multiplo de 8)
+#   notas     -> time float64[n], length float32[n], direction int8[n],
+#                must_hit bool[n], ya ordenadas por tiempo
+CACHE_EXTENSION = ".fnfchart"
+CACHE_MAGIC = b"FNFC"
+CACHE_VERSION = 2
+CACHE_DIR = os.path.join("cache", "charts")
+HEADER = struct.Struct("<4sHxxqQII")
+
+def get_cache_path(json_path, cache_dir=None):
+    if cache_dir:
+        return os.path.join(cache_dir, os.path.basename(os.path.splitext(json_path)[0]) + CACHE_EXTENSION)
+    return os.path.splitext(json_path)[0] + CACHE_EXTENSION
+
+def _source_signature(json_path):
+    stat = os.stat(json_path)
+    return stat.st_mtime_ns, stat.st_size
+
+def write_chart_cache(json_path, song, cache_path=None):
+    cache_path = cache_path or get_cache_path(json_path)
+    mtime_ns, size = _source_signature(json_path)
+
+    chart = song.chart
+    metadata = json.dumps({
+        "song": song.name,
+        "bpm": song.bpm,
+        "needsVoicing": song.needs_voicing,
+        "sections": song.sections
+    }).encode("utf-8")
+    metadata += b" " * (-(HEADER.size + len(metadata)) % 8)
+
+    directory = os.path.dirname(cache_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(CACHE_MAGIC, CACHE_VERSION, mtime_ns, size, len(chart), len(metadata)))
+        f.write(metadata)
+        f.write(chart.time.astype("<f8").tobytes())
+        f.write(chart.length.astype("<f4").tobytes())
+        f.write(chart.direction.astype("i1").tobytes())
+        f.write(chart.must_hit.astype("?").tobytes())
+    os.replace(tmp_path, cache_path)
+    return cache_path
+
+def load_chart_cache(json_path, cache_path=None):
+    """Devuelve (metadatos, ChartStore) o None si no hay cache valido."""
+    cache_path = cache_path or get_cache_path(json_path)
+    if not os.path.exists(cache_path) or not os.path.exists(json_path):
+        return None
+
+    with open(cache_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < HEADER.size:
+            return None
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, mtime_ns, size, note_count, metadata_size = HEADER.unpack_from(data, 0)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        return None
+    if (mtime_ns, size) != _source_signature(json_path):
+        return None
+
+    offset = HEADER.size
+    if len(data) != offset + metadata_size + note_count * (8 + 4 + 1 + 1):
+        return None
+
+    metadata = json.loads(bytes(data[offset:offset + metadata_size]).decode("utf-8"))
+    offset += metadata_size
+
+    # Las columnas son vistas de solo lectura sobre el mmap, sin copiar
+    times = np.frombuffer(data, dtype="<f8", count=note_count, offset=offset)
+    offset += times.nbytes
+    lengths = np.frombuffer(data, dtype="<f4", count=note_count, offset=offset)
+    offset += lengths.nbytes
+    directions = np.frombuffer(data, dtype=np.int8, count=note_count, offset=offset)
+    offset += directions.nbytes
+    must_hits = np.frombuffer(data, dtype=np.bool_, count=note_count, offset=offset)
+
+    return metadata, ChartStore(times, directions, lengths, must_hits, presorted=True)
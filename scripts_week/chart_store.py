@@ -0,0 +1,107 @@
+import numpy as np
+
+# Flags de estado por nota
+STATE_SPAWNED = 1
+STATE_HIT = 2
+STATE_MISSED = 4
+
+NOTE_SPEED_PIXELS = 500     # pixeles por segundo con speed = 1.0
+FADE_DISTANCE = 2.0         # segundos de lookahead usados para alpha/escala
+
+NO_ROWS = np.zeros(0, dtype=np.intp)
+
+class ChartStore:
+    """Notas de un chart guardadas como arrays paralelos de NumPy.
+
+    Una fila por nota, ordenadas por tiempo. Las posiciones, alpha y
+    escala de las notas visibles se calculan de una vez por frame en
+    update_window(); los objetos Note solo son vistas sobre una fila.
+    """
+
+    def __init__(self, times, directions, lengths, must_hits, presorted=False):
+        self.time = np.asarray(times, dtype=np.float64)
+        self.direction = np.asarray(directions, dtype=np.int8)
+        self.length = np.asarray(lengths, dtype=np.float32)
+        self.must_hit = np.asarray(must_hits, dtype=np.bool_)
+
+        # presorted: columnas ya ordenadas (p.ej. del cache binario), se usan sin copiar
+        if not presorted:
+            order = np.argsort(self.time, kind="stable")
+            self.time = self.time[order]
+            self.direction = self.direction[order]
+            self.length = self.length[order]
+            self.must_hit = self.must_hit[order]
+        self.state = np.zeros(len(self.time), dtype=np.uint8)
+
+        self.y = np.zeros(len(self.time), dtype=np.float32)
+        self.alpha = np.full(len(self.time), 255, dtype=np.uint8)
+        self.scale = np.ones(len(self.time), dtype=np.float32)
+
+    @classmethod
+    def from_sections(cls, sections):
+        times = []
+        directions = []
+        lengths = []
+        must_hits = []
+
+        for section in sections:
+            must_hit_section = section.get("mustHitSection", True)
+            for note_data in section.get("sectionNotes", []):
+                times.append(note_data[0] / 1000.0)
+                directions.append(note_data[1])
+                lengths.append(note_data[2] if len(note_data) > 2 else 0)
+                must_hits.append(must_hit_section)
+
+        return cls(times, directions, lengths, must_hits)
+
+    def __len__(self):
+        return len(self.time)
+
+    def get_nbytes(self):
+        return sum(array.nbytes for array in (self.time, self.direction, self.length, self.must_hit,
+                                              self.state, self.y, self.alpha, self.scale))
+
+    def reset(self, start=0, end=None):
+        self.state[start:end] = 0
+        self.alpha[start:end] = 255
+        self.scale[start:end] = 1.0
+
+    def search(self, time, side="left"):
+        return int(np.searchsorted(self.time, time, side=side))
+
+    def get_end_time(self):
+        if len(self.time) == 0:
+            return 0.0
+        return float(np.max(self.time + self.length / 1000.0))
+
+    def mark(self, index, flag):
+        self.state[index] |= flag
+
+    def update_window(self, start, end, current_time, target_y, speed=1.0):
+        # Unico lugar donde se detectan fallos: solo las filas vivas (spawneadas,
+        # sin hit ni miss) se mueven o pasan a STATE_MISSED. Devuelve las filas
+        # que pasaron en este frame
+        if end <= start:
+            return NO_ROWS
+
+        state = self.state[start:end]
+        live = (state & STATE_SPAWNED) != 0
+        live &= (state & (STATE_HIT | STATE_MISSED)) == 0
+
+        time_until_hit = self.time[start:end] - current_time
+        approaching = time_until_hit > 0
+        moving = live & approaching
+
+        distance_ratio = time_until_hit / FADE_DISTANCE
+        y = target_y - time_until_hit * NOTE_SPEED_PIXELS * speed
+        alpha = np.clip(255.0 * (1.0 - distance_ratio * 0.5), 0.0, 255.0)
+        scale = 0.8 + 0.2 * distance_ratio
+
+        # Igual que antes: una nota que ya paso conserva su ultima posicion
+        np.copyto(self.y[start:end], y, where=moving, casting="unsafe")
+        np.copyto(self.alpha[start:end], alpha.astype(np.int32), where=moving, casting="unsafe")
+        np.copyto(self.scale[start:end], scale, where=moving, casting="unsafe")
+
+        passed = live & ~approaching
+        state[passed] |= STATE_MISSED
+        return np.flatnonzero(passed) + start
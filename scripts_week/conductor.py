@@ -0,0 +1,133 @@
+import time
+
+class Conductor:
+    """Reloj de la cancion guiado por la posicion real del audio.
+
+    pygame.mixer.music.get_pos() solo avanza de a bloques del buffer del
+    mixer, asi que entre lecturas el tiempo se interpola con perf_counter.
+    Cuando el mixer reporta una posicion nueva se compara con el reloj
+    interpolado: una deriva chica se corrige de a poco y una grande
+    (pausas, underruns, fades) se resincroniza de golpe.
+    """
+
+    def __init__(self, audio_manager=None, bpm=100, resync_threshold=0.05,
+                 smoothing=0.1, time_source=time.perf_counter):
+        self.audio_manager = audio_manager
+        self.time_source = time_source
+        self.resync_threshold = resync_threshold
+        self.smoothing = smoothing
+
+        self.song = None
+        self.offset = 0.0   # latencia de audio a compensar, en segundos
+        self.set_bpm(bpm)
+
+        self.playing = False
+        self.song_time = 0.0
+        self.anchor_song_time = 0.0
+        self.anchor_clock = 0.0
+        self.last_audio_position = None
+        self.music_start_time = 0.0
+        self.resync_count = 0
+
+        self.current_beat = 0
+        self.current_step = 0
+        self.beat_hit = False
+        self.step_hit = False
+
+    def set_bpm(self, bpm):
+        self.bpm = bpm
+        self.beat_duration = 60.0 / bpm
+        self.step_duration = self.beat_duration / 4
+
+    def set_song(self, song):
+        self.song = song
+        if song:
+            self.set_bpm(song.bpm)
+
+    def start(self, start_time=0.0):
+        # start_time es la posicion de la cancion en la que arranca la musica
+        self.music_start_time = start_time
+        self.song_time = start_time
+        self.anchor_song_time = start_time
+        self.anchor_clock = self.time_source()
+        self.last_audio_position = None
+        self.playing = True
+        self.current_step = int(self.get_step())
+        self.current_beat = self.current_step // 4
+
+    def stop(self):
+        self.playing = False
+
+    def pause(self):
+        if self.playing:
+            self.song_time = self._interpolate()
+            self.playing = False
+
+    def resume(self):
+        if not self.playing:
+            self.anchor_song_time = self.song_time
+            self.anchor_clock = self.time_source()
+            self.playing = True
+
+    def update(self):
+        self.beat_hit = False
+        self.step_hit = False
+        if not self.playing:
+            return self.song_time
+
+        interpolated = self._interpolate()
+
+        audio_time = self._read_audio_time()
+        if audio_time is not None and audio_time != self.last_audio_position:
+            self.last_audio_position = audio_time
+            drift = audio_time - interpolated
+
+            if abs(drift) > self.resync_threshold:
+                self.anchor_song_time = audio_time
+                self.anchor_clock = self.time_source()
+                interpolated = audio_time
+                self.resync_count += 1
+            else:
+                self.anchor_song_time += drift * self.smoothing
+                interpolated += drift * self.smoothing
+
+        # Las correcciones suaves nunca hacen retroceder el reloj
+        if interpolated > self.song_time or abs(interpolated - self.song_time) > self.resync_threshold:
+            self.song_time = interpolated
+
+        step = int(self.get_step())
+        beat = step // 4
+        self.beat_hit = beat != self.current_beat
+        self.step_hit = step != self.current_step
+        self.current_beat = beat
+        self.current_step = step
+
+        return self.song_time
+
+    def get_song_time(self):
+        return self.song_time
+
+    def get_beat(self):
+        return self.get_step() / 4
+
+    def get_step(self):
+        # Con cancion se usa su mapa de tiempos (cambios de BPM incluidos)
+        if self.song:
+            return self.song.timing.time_to_step(self.song_time)
+        return self.song_time / self.step_duration
+
+    def get_section(self):
+        if self.song:
+            return self.song.get_section_at_time(self.song_time)
+        return None
+
+    def _interpolate(self):
+        return self.anchor_song_time + (self.time_source() - self.anchor_clock)
+
+    def _read_audio_time(self):
+        if self.audio_manager is None:
+            return None
+        position = self.audio_manager.get_music_position()
+        if position is None:
+            return None
+        return self.music_start_time + position - self.offset
@@ -1,86 +1,100 @@
 import pygame
 from .note_renderer import note_renderer
+from .chart_store import STATE_SPAWNED, STATE_HIT, STATE_MISSED
 
 class Note:
-    def __init__(self, direction, time, must_hit=True, length=0):
-        self.direction = direction  # 0: left, 1: down, 2: up, 3: right
-        self.time = time  
-        self.must_hit = must_hit  
-        self.length = length  
-        self.active = True
-        self.hit = False
-        self.missed = False
-        self.perfect = False
-        self.good = False
-        self.bad = False
-        
-        self.x = 0
-        self.y = 0
-        self.speed = 1.0
+    # Vista sobre una fila del ChartStore: y, alpha, scale y los flags de
+    # hit/miss se calculan vectorizados en ChartStore.update_window() y se
+    # leen desde ahi. Lo unico por objeto es la animacion de confirmacion.
+    # Los objetos se reciclan con NotePool, por eso todo el estado se
+    # inicializa en reset()
+    __slots__ = ("chart", "index", "direction", "time", "must_hit", "length", "speed", "judgement",
+                 "confirm_animation_frame", "confirm_animation_timer", "showing_confirm")
+    
+    def __init__(self, chart, index, speed=1.0):
+        self.reset(chart, index, speed)
+    
+    def reset(self, chart, index, speed=1.0):
+        self.chart = chart
+        self.index = index
+        self.direction = int(chart.direction[index])  # 0: left, 1: down, 2: up, 3: right
+        self.time = float(chart.time[index])
+        self.must_hit = bool(chart.must_hit[index])
+        self.length = float(chart.length[index])
+        self.speed = speed
+        self.judgement = None   # "perfect", "good" o "bad"
         
-
         self.confirm_animation_frame = 0
         self.confirm_animation_timer = 0
         self.showing_confirm = False
         
-     
-        self.alpha = 255
-        self.scale = 1.0
+        chart.mark(index, STATE_SPAWNED)
     
-    def update(self, dt, target_y, current_time):
+    @property
+    def hit(self):
+        return bool(self.chart.state[self.index] & STATE_HIT)
     
-        if not self.active:
-
-            if self.showing_confirm:
-                self.confirm_animation_timer += dt
-                if self.confirm_animation_timer > 0.05:
-                    self.confirm_animation_timer = 0
-                    self.confirm_animation_frame += 1
-                    if self.confirm_animation_frame >= 4: 
-                        self.showing_confirm = False
-            return
-            
-
-        time_until_hit = self.time - current_time
-        
-        if time_until_hit > 0:
-            self.y = target_y - (time_until_hit * 500 * self.speed)
-            
-            distance_ratio = time_until_hit / 2.0  
-            self.alpha = min(255, int(255 * (1.0 - distance_ratio * 0.5)))
-            self.scale = 0.8 + (0.2 * distance_ratio)
-        else:
-
-            if not self.hit and not self.missed:
-                self.missed = True
-                self.active = False
+    @property
+    def missed(self):
+        return bool(self.chart.state[self.index] & STATE_MISSED)
+    
+    @property
+    def active(self):
+        return not self.chart.state[self.index] & (STATE_HIT | STATE_MISSED)
+    
+    @property
+    def perfect(self):
+        return self.judgement == "perfect"
+    
+    @property
+    def good(self):
+        return self.judgement == "good"
+    
+    @property
+    def bad(self):
+        return self.judgement == "bad"
+    
+    @property
+    def y(self):
+        return float(self.chart.y[self.index])
+    
+    @property
+    def alpha(self):
+        return int(self.chart.alpha[self.index])
+    
+    @property
+    def scale(self):
+        return float(self.chart.scale[self.index])
+    
+    def update_confirm(self, dt):
+        # Devuelve si la animacion de confirmacion sigue en curso
+        if self.showing_confirm:
+            self.confirm_animation_timer += dt
+            if self.confirm_animation_timer > 0.05:
+                self.confirm_animation_timer = 0
+                self.confirm_animation_frame += 1
+                if self.confirm_animation_frame >= 4: 
+                    self.showing_confirm = False
+        return self.showing_confirm
     
     def check_hit(self, input_time, perfect_threshold=0.05, good_threshold=0.1, bad_threshold=0.15):
-        if not self.active or self.hit or self.missed:
+        if not self.active:
             return False
             
         time_diff = abs(input_time - self.time)
         
         if time_diff <= perfect_threshold:
-            self.hit = True
-            self.perfect = True
-            self.active = False
-            self.show_confirm_animation()
-            return "perfect"
+            self.judgement = "perfect"
         elif time_diff <= good_threshold:
-            self.hit = True  
-            self.good = True
-            self.active = False
-            self.show_confirm_animation()
-            return "good"
+            self.judgement = "good"
         elif time_diff <= bad_threshold:
-            self.hit = True
-            self.bad = True
-            self.active = False
-            self.show_confirm_animation()
-            return "bad"
-            
-        return False
+            self.judgement = "bad"
+        else:
+            return False
+        
+        self.chart.mark(self.index, STATE_HIT)
+        self.show_confirm_animation()
+        return self.judgement
     
     def show_confirm_animation(self):
         self.showing_confirm = True
@@ -123,4 +137,34 @@ class Note:
         sustain_color = note_renderer.arrow_colors[self.direction]
         pygame.draw.rect(screen, sustain_color, sustain_rect)
         
-        pygame.draw.rect(screen, (255, 255, 255), sustain_rect, 1)
\ No newline at end of file
+        pygame.draw.rect(screen, (255, 255, 255), sustain_rect, 1)
+
+class NotePool:
+    """Reutiliza objetos Note entre spawn y despawn.
+
+    Solo hay tantos objetos como notas visibles a la vez; reiniciar la
+    cancion devuelve los vivos al pool en vez de crear otros.
+    """
+    
+    def __init__(self):
+        self.free = []
+        self.created = 0
+    
+    def acquire(self, chart, index, speed=1.0):
+        if self.free:
+            note = self.free.pop()
+            note.reset(chart, index, speed)
+            return note
+        
+        self.created += 1
+        return Note(chart, index, speed)
+    
+    def release(self, note):
+        self.free.append(note)
+    
+    def release_all(self, notes):
+        self.free.extend(notes)
+    
+    def clear(self):
+        self.free.clear()
+        self.created = 0
@@ -1,6 +1,13 @@
 import pygame
 from .sprite_loader import SpriteLoader
 
+# Las notas se dibujan con tamanos y alphas cuantizados para poder
+# reutilizar surfaces pre-escaladas en vez de escalar nota por nota
+SIZE_STEP = 4
+ALPHA_STEP = 32
+PRERENDER_SIZES = range(80, 101, SIZE_STEP)      # Note.scale va de 0.8 a 1.0
+PRERENDER_ALPHAS = (128, 160, 192, 224, 255)     # Note.alpha va de ~127 a 255
+
 class NoteRenderer:
     def __init__(self):
         self.sprite_loader = SpriteLoader()
@@ -8,8 +15,22 @@ class NoteRenderer:
         self.arrow_frames = {}
         self.press_animations = {}
         self.confirm_animations = {}
+        self.sprite_cache = {}
+        self.loaded = False
         
-        self.load_note_assets()
+        self.arrow_colors = [
+            (255, 0, 0),    # Rojo - Izquierda
+            (0, 255, 0),    # Verde - Abajo  
+            (0, 0, 255),    # Azul - Arriba
+            (255, 255, 0)   # Amarillo - Derecha
+        ]
+    
+    def ensure_loaded(self):
+        # Se carga al entrar a una semana y no al importar el modulo,
+        # para que la pantalla de carga pueda precargar NOTE_assets antes
+        if not self.loaded:
+            self.loaded = True
+            self.load_note_assets()
     
     def load_note_assets(self):
 
@@ -50,12 +71,33 @@ class NoteRenderer:
             3: self.create_animation(["right confirm0000", "right confirm0001", "right confirm0002", "right confirm0003"])
         }
         
-        self.arrow_colors = [
-            (255, 0, 0),    # Rojo - Izquierda
-            (0, 255, 0),    # Verde - Abajo  
-            (0, 0, 255),    # Azul - Arriba
-            (255, 255, 0)   # Amarillo - Derecha
-        ]
+        self.prerender_notes()
+    
+    def prerender_notes(self):
+        for frame in self.arrow_frames.values():
+            if not frame:
+                continue
+            for size in PRERENDER_SIZES:
+                for alpha in PRERENDER_ALPHAS:
+                    self.get_sprite(frame, size, size, alpha)
+    
+    def quantize_size(self, value):
+        return max(SIZE_STEP, int(round(value / SIZE_STEP)) * SIZE_STEP)
+    
+    def quantize_alpha(self, alpha):
+        if alpha >= 255:
+            return 255
+        return max(0, min(255, int(round(alpha / ALPHA_STEP)) * ALPHA_STEP))
+    
+    def get_sprite(self, frame, width, height, alpha=255):
+        key = (frame["name"], width, height, alpha)
+        sprite = self.sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.transform.scale(frame["surface"], (width, height))
+            if alpha < 255:
+                sprite.set_alpha(alpha)
+            self.sprite_cache[key] = sprite
+        return sprite
     
     def get_frame(self, frame_name):
         return self.note_frames.get(frame_name)
@@ -72,12 +114,12 @@ class NoteRenderer:
         frame = self.arrow_frames.get(direction)
         
         if frame and frame["surface"]:
-            scaled_surface = pygame.transform.scale(frame["surface"], (width, height))
+            sprite_width = self.quantize_size(width)
+            sprite_height = self.quantize_size(height)
+            sprite = self.get_sprite(frame, sprite_width, sprite_height, self.quantize_alpha(alpha))
             
-            if alpha < 255:
-                scaled_surface.set_alpha(alpha)
-                
-            screen.blit(scaled_surface, (x, y))
+            # Centrar el sprite cuantizado sobre el rect pedido
+            screen.blit(sprite, (x + (width - sprite_width) // 2, y + (height - sprite_height) // 2))
         else:
             color = self.arrow_colors[direction]
             note_rect = pygame.Rect(x, y, width, height)
@@ -90,8 +132,7 @@ class NoteRenderer:
             if animation_frame < len(animation):
                 frame = animation[animation_frame]
                 if frame and frame["surface"]:
-                    scaled_surface = pygame.transform.scale(frame["surface"], (width, height))
-                    screen.blit(scaled_surface, (x, y))
+                    screen.blit(self.get_sprite(frame, width, height), (x, y))
                     return
         else:
             self.draw_note(screen, direction, x, y, width, height)
@@ -102,8 +143,7 @@ class NoteRenderer:
             if animation_frame < len(animation):
                 frame = animation[animation_frame]
                 if frame and frame["surface"]:
-                    scaled_surface = pygame.transform.scale(frame["surface"], (width, height))
-                    screen.blit(scaled_surface, (x - (width - 100) // 2, y - (height - 100) // 2))
+                    screen.blit(self.get_sprite(frame, width, height), (x - (width - 100) // 2, y - (height - 100) // 2))
                     return True
         return False
     
@@ -0,0 +1,116 @@
+import os
+import struct
+import sys
+from array import array
+
+# Formato .fnfreplay (little endian):
+#   cabecera -> magic, version, numero de eventos, bytes del nombre
+#   nombre   -> nombre de la cancion en UTF-8
+#   tiempos  -> float64[n], tiempo de cancion de cada evento
+#   codigos  -> uint8[n], bits 0-1 carril, bit 7 = pulsado (0 = soltado)
+REPLAY_EXTENSION = ".fnfreplay"
+REPLAY_MAGIC = b"FNFR"
+REPLAY_VERSION = 1
+HEADER = struct.Struct("<4sHxxII")
+PRESS_FLAG = 0x80
+
+class Replay:
+    def __init__(self, song_name="", times=None, codes=None):
+        self.song_name = song_name
+        self.times = times if times is not None else array('d')
+        self.codes = codes if codes is not None else array('B')
+
+    def __len__(self):
+        return len(self.times)
+
+    def add(self, time, direction, pressed):
+        self.times.append(time)
+        self.codes.append((direction & 0x03) | (PRESS_FLAG if pressed else 0))
+
+    def get_event(self, index):
+        code = self.codes[index]
+        return self.times[index], code & 0x03, bool(code & PRESS_FLAG)
+
+    def get_presses(self):
+        # (tiempo, carril) de cada pulsacion, el formato del input scripteado
+        return [(self.times[i], self.codes[i] & 0x03) for i in range(len(self.times))
+                if self.codes[i] & PRESS_FLAG]
+
+    def save(self, path):
+        name = self.song_name.encode("utf-8")
+        times = array('d', self.times)
+        if sys.byteorder != 'little':
+            times.byteswap()
+
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, len(self.times), len(name)))
+            f.write(name)
+            f.write(times.tobytes())
+            f.write(self.codes.tobytes())
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if len(data) < HEADER.size:
+            return None
+        magic, version, event_count, name_size = HEADER.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            return None
+        if len(data) != HEADER.size + name_size + event_count * 9:
+            return None
+
+        offset = HEADER.size
+        try:
+            song_name = data[offset:offset + name_size].decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+        offset += name_size
+
+        times = array('d')
+        times.frombytes(data[offset:offset + event_count * 8])
+        if sys.byteorder != 'little':
+            times.byteswap()
+        offset += event_count * 8
+
+        codes = array('B')
+        codes.frombytes(data[offset:offset + event_count])
+        return cls(song_name, times, codes)
+
+class ReplayRecorder:
+    def __init__(self, song_name=""):
+        self.replay = Replay(song_name)
+
+    def reset(self, song_name=None):
+        self.replay = Replay(self.replay.song_name if song_name is None else song_name)
+
+    def record(self, time, direction, pressed):
+        self.replay.add(time, direction, pressed)
+
+    def save(self, path):
+        return self.replay.save(path)
+
+class ReplayPlayer:
+    """Devuelve los eventos de un Replay a medida que avanza la cancion."""
+
+    def __init__(self, replay):
+        self.replay = replay
+        self.cursor = 0
+
+    def reset(self):
+        self.cursor = 0
+
+    def is_finished(self):
+        return self.cursor >= len(self.replay)
+
+    def poll(self, current_time):
+        events = []
+        times = self.replay.times
+        while self.cursor < len(times) and times[self.cursor] <= current_time:
+            events.append(self.replay.get_event(self.cursor))
+            self.cursor += 1
+        return events
@@ -1,14 +1,16 @@
 import pygame
 import json
 import os
-from .note import Note
+from .note import NotePool
+from .chart_store import ChartStore
+from .timing_map import TimingMap
+from .chart_cache import load_chart_cache, write_chart_cache, get_cache_path, CACHE_DIR
 
 class Song:
-    def __init__(self, name, bpm, notes_data, speed=1.0, needs_voicing=False):
+    def __init__(self, name, bpm, notes_data, speed=1.0, needs_voicing=False, chart=None):
         self.name = name
         self.bpm = bpm
         self.speed = speed
-        self.notes_data = notes_data
         self.needs_voicing = needs_voicing
         
 
@@ -20,47 +22,34 @@ class Song:
         self.step_duration = self.beat_duration / 4  # 16th notes
         self.measures = []
         
-        self.all_notes = []
-        self.processed_notes = set()
+        # Las notas viven en arrays (ChartStore); los objetos Note solo
+        # existen mientras estan spawneadas
+        self.chart = None
+        self.note_pool = NotePool()
+        self.spawned_notes = {}
+        self.spawn_cursor = 0
+        self.sections = []
+        self.timing = None
         
         self.total_notes = 0
         self.duration = 0
 
-        self.process_song_data()
+        self.process_song_data(notes_data, chart)
     
-    def process_song_data(self):
-        self.all_notes = []
-        max_time = 0
+    def process_song_data(self, notes_data, chart=None):
+        # Con chart ya construido (cache binario) notes_data solo trae metadatos
+        self.chart = chart if chart is not None else ChartStore.from_sections(notes_data)
         
-        for section_index, section in enumerate(self.notes_data):
-            must_hit_section = section.get("mustHitSection", True)
-            section_notes = section.get("sectionNotes", [])
-            section_bpm = section.get("bpm", self.bpm)
-            section_change_bpm = section.get("changeBPM", False)
-            
-            for note_data in section_notes:
-                time_ms = note_data[0]
-                direction = note_data[1]
-                length_ms = note_data[2] if len(note_data) > 2 else 0
-                
-                time_seconds = time_ms / 1000.0
-                
-                note = Note(
-                    direction=direction,
-                    time=time_seconds,
-                    must_hit=must_hit_section,
-                    length=length_ms
-                )
-                
-                note.speed = self.speed
-                self.all_notes.append(note)
-                
-                note_end_time = time_seconds + (length_ms / 1000.0) if length_ms > 0 else time_seconds
-                max_time = max(max_time, note_end_time)
+        # Del JSON solo se guardan los metadatos de cada seccion, sin las notas
+        self.sections = [{key: value for key, value in section.items() if key != "sectionNotes"}
+                         for section in notes_data]
+        self.timing = TimingMap(self.bpm, self.sections)
         
-        self.all_notes.sort(key=lambda note: note.time)
-        self.total_notes = len(self.all_notes)
-        self.duration = max_time
+        self.spawn_cursor = 0
+        self.note_pool.release_all(self.spawned_notes.values())
+        self.spawned_notes.clear()
+        self.total_notes = len(self.chart)
+        self.duration = self.chart.get_end_time()
         
         print(f"Canción '{self.name}' procesada: {self.total_notes} notas, duración: {self.duration:.2f}s")
     
@@ -68,13 +57,11 @@ class Song:
         self.current_time = 0
         self.playing = True
         self.completed = False
-        self.processed_notes.clear()
-        
-        for note in self.all_notes:
-            note.active = True
-            note.hit = False
-            note.missed = False
-            note.showing_confirm = False
+        self.spawn_cursor = 0
+        # Reiniciar devuelve las notas vivas al pool; no se recorre el chart
+        self.note_pool.release_all(self.spawned_notes.values())
+        self.spawned_notes.clear()
+        self.chart.reset()
     
     def update(self, dt):
         if self.playing:
@@ -87,51 +74,81 @@ class Song:
     def get_current_notes(self, lookahead_time=2.0):
         current_notes = []
         
-
-            if (note.time >= self.current_time and 
-                note.time <= self.current_time + lookahead_time and
-                note.active and not note.hit and not note.missed):
+        start = self.chart.search(self.current_time)
+        end = self.chart.search(self.current_time + lookahead_time, side="right")
+        for index in range(start, end):
+            note = self.spawned_notes.get(index)
+            if note and note.active:
                 current_notes.append(note)
         
         return current_notes
     
     def get_notes_for_spawning(self, lookahead_time=2.0):
+        # El chart esta ordenado por tiempo: el cursor solo avanza y cada
+        # llamada cuesta lo que se spawnea en ese frame, no el largo del chart
         notes_to_spawn = []
+        chart = self.chart
         
-        for note in self.all_notes:
-            note_id = f"{note.time}_{note.direction}_{note.must_hit}"
-            
-            if (note.time >= self.current_time and 
-                note.time <= self.current_time + lookahead_time and
-                note_id not in self.processed_notes):
-                
-                notes_to_spawn.append(note)
-                self.processed_notes.add(note_id)
+        cursor = self.spawn_cursor
+        if cursor < len(chart) and chart.time[cursor] < self.current_time:
+            # Las notas que ya pasaron sin spawnear se saltan
+            cursor = chart.search(self.current_time)
+        
+        end = chart.search(self.current_time + lookahead_time, side="right")
+        for index in range(cursor, end):
+            note = self.note_pool.acquire(chart, index, self.speed)
+            self.spawned_notes[index] = note
+            notes_to_spawn.append(note)
         
+        self.spawn_cursor = max(cursor, end)
         return notes_to_spawn
     
+    def despawn(self, note):
+        if self.spawned_notes.pop(note.index, None) is note:
+            self.note_pool.release(note)
+    
+    def seek(self, time):
+        # Para pausa, reinicio o saltos de practica: recoloca el cursor
+        # en la primera nota en o despues de 'time'. Las notas vivas vuelven
+        # al pool (BaseWeek.seek_song las saca antes de active_notes), si no
+        # un salto hacia atras spawnearia otra vez filas que siguen en juego
+        self.note_pool.release_all(self.spawned_notes.values())
+        self.spawned_notes.clear()
+        
+        cursor = self.chart.search(time)
+        if cursor < self.spawn_cursor:
+            # Las filas que se vuelven a jugar pierden sus marcas de hit/miss
+            self.chart.reset(cursor, self.spawn_cursor)
+        
+        self.current_time = time
+        self.spawn_cursor = cursor
+    
     def get_beat_time(self, beat_number):
 
-        return beat_number * self.beat_duration
+        return self.timing.beat_to_time(beat_number)
     
     def get_measure_time(self, measure_number):
-        return measure_number * self.beat_duration * 4
+        return self.timing.beat_to_time(measure_number * 4)
     
+    def get_current_beat(self):
 
-        return int(self.current_time / self.beat_duration)
+        return int(self.timing.time_to_beat(self.current_time))
+    
+    def get_current_step(self):
+        return int(self.timing.time_to_step(self.current_time))
     
     def get_current_measure(self):
 
-        return int(self.current_time / (self.beat_duration * 4))
+        return int(self.timing.time_to_beat(self.current_time) / 4)
     
     def get_beat_progress(self):
 
-        current_beat = self.current_time / self.beat_duration
+        current_beat = self.timing.time_to_beat(self.current_time)
         return current_beat - int(current_beat)
     
     def get_measure_progress(self):
 
-        current_measure = self.current_time / (self.beat_duration * 4)
+        current_measure = self.timing.time_to_beat(self.current_time) / 4
         return current_measure - int(current_measure)
     
     def get_progress(self):
@@ -142,8 +159,8 @@ class Song:
     
     def get_notes_count(self):
  
-        total = len(self.all_notes)
-        player_notes = sum(1 for note in self.all_notes if note.must_hit)
+        total = len(self.chart)
+        player_notes = int(self.chart.must_hit.sum())
         opponent_notes = total - player_notes
         
         return {
@@ -154,20 +171,10 @@ class Song:
         }
     
     def get_section_at_time(self, time):
-        accumulated_time = 0
-        for section in self.notes_data:
-            section_notes = section.get("sectionNotes", [])
-            if section_notes:
-                section_duration = (max(note[0] for note in section_notes) - min(note[0] for note in section_notes)) / 1000.0
-            else:
-                section_duration = 4 * self.beat_duration  
-            
-            if accumulated_time <= time < accumulated_time + section_duration:
-                return section
-            
-            accumulated_time += section_duration
-        
-        return None
+        section_index = self.timing.time_to_section(time)
+        if section_index is None:
+            return None
+        return self.sections[section_index]
     
     def stop(self):
 
@@ -188,22 +195,62 @@ class Song:
         return self.completed
     
     @classmethod
-    def from_json_file(cls, json_path, speed=1.0):
+    def from_json_file(cls, json_path, speed=1.0, use_cache=True):
+        if use_cache:
+            song = cls.from_chart_cache(json_path, speed)
+            if song:
+                return song
+        
         try:
             with open(json_path, "r", encoding="utf-8") as f:
                 song_data = json.load(f)
             
             song_info = song_data["song"]
-            return cls(
+            song = cls(
                 name=song_info.get("song", "Unknown"),
                 bpm=song_info.get("bpm", 100),
                 notes_data=song_info.get("notes", []),
                 speed=speed,
-                needs_voicing=song_info.get("needsVoicing", False)
+                # Los charts de FNF usan "needsVoices"
+                needs_voicing=song_info.get("needsVoices", song_info.get("needsVoicing", False))
             )
         except Exception as e:
             print(f"Error cargando canción desde {json_path}: {e}")
             return cls.create_default_song()
+        
+        if use_cache:
+            song.write_chart_cache(json_path)
+        return song
+    
+    @classmethod
+    def from_chart_cache(cls, json_path, speed=1.0):
+        for cache_path in (get_cache_path(json_path), get_cache_path(json_path, CACHE_DIR)):
+            try:
+                cached = load_chart_cache(json_path, cache_path)
+            except Exception as e:
+                print(f"Cache de chart inválido {cache_path}: {e}")
+                cached = None
+            
+            if cached:
+                metadata, chart = cached
+                return cls(
+                    name=metadata.get("song", "Unknown"),
+                    bpm=metadata.get("bpm", 100),
+                    notes_data=metadata.get("sections", []),
+                    speed=speed,
+                    needs_voicing=metadata.get("needsVoicing", False),
+                    chart=chart
+                )
+        return None
+    
+    def write_chart_cache(self, json_path):
+        # Junto al JSON si se puede; si no, en la carpeta de cache
+        for cache_path in (get_cache_path(json_path), get_cache_path(json_path, CACHE_DIR)):
+            try:
+                return write_chart_cache(json_path, self, cache_path)
+            except OSError as e:
+                print(f"No se pudo escribir el cache de chart en {cache_path}: {e}")
+        return None
     
     @classmethod
     def create_default_song(cls):
@@ -0,0 +1,123 @@
+import pygame
+import os
+from scripts.mixer_service import mixer_service
+
+VOCALS_CHANNEL = 0
+
+class SongPlayer:
+    """Instrumental por pygame.mixer.music y voces en un canal reservado.
+
+    El instrumental va por el stream de musica del AudioManager de la
+    semana, que es lo que sigue el Conductor. Las voces se decodifican al
+    cargar y suenan en un canal reservado por MixerService, asi ningun
+    sonido del pool se las puede robar. Arrancan (o saltan) junto con el
+    instrumental; fallar una nota solo baja su volumen a 0.
+    """
+
+    def __init__(self, audio_manager, instrumental_path, vocals_path=None):
+        self.audio_manager = audio_manager
+        self.instrumental_path = instrumental_path if instrumental_path and os.path.exists(instrumental_path) else None
+        if self.instrumental_path is None:
+            print(f"SongPlayer: Archivo no encontrado: {instrumental_path}")
+
+        self.vocals = self._decode(vocals_path) if vocals_path else None
+        self.vocals_raw = None
+        self.vocals_channel = mixer_service.get_stream_channel(VOCALS_CHANNEL)
+
+        mixer_init = pygame.mixer.get_init()
+        if mixer_init:
+            frequency, size, channels = mixer_init
+            self.frequency = frequency
+            self.frame_bytes = abs(size) // 8 * channels
+        else:
+            self.frequency = 44100
+            self.frame_bytes = 4
+
+        self.playing = False
+        self.paused = False
+        self.start_time = 0.0
+        self.vocals_muted = False
+
+    def _decode(self, path):
+        if not os.path.exists(path):
+            print(f"SongPlayer: Archivo no encontrado: {path}")
+            return None
+        try:
+            return pygame.mixer.Sound(path)
+        except pygame.error as e:
+            print(f"SongPlayer: Error decodificando {path}: {e}")
+            return None
+
+    def is_loaded(self):
+        return self.instrumental_path is not None
+
+    def has_vocals(self):
+        return self.vocals is not None and self.vocals_channel is not None
+
+    def play(self, start_time=0.0):
+        if not self.is_loaded():
+            return False
+        if not self.audio_manager.play_music(self.instrumental_path, loop=0, start=start_time):
+            # Sin instrumental no quedan voces sueltas sonando
+            self.stop()
+            return False
+
+        self.start_time = start_time
+        self.playing = True
+        self.paused = False
+        if self.has_vocals():
+            self._start_vocals(start_time)
+        return True
+
+    def stop(self):
+        if self.vocals_channel:
+            self.vocals_channel.stop()
+        self.playing = False
+        self.paused = False
+
+    def pause(self):
+        # El instrumental lo pausa el AudioManager (BaseWeek.toggle_pause)
+        if not self.playing or self.paused:
+            return
+        if self.has_vocals():
+            self.vocals_channel.pause()
+        self.paused = True
+
+    def resume(self):
+        if not self.paused:
+            return
+        if self.has_vocals():
+            self.vocals_channel.unpause()
+        self.paused = False
+
+    def get_position(self):
+        # Posicion del instrumental segun el mixer; None si no esta sonando
+        music_position = self.audio_manager.get_music_position()
+        if music_position is None:
+            return None
+        return self.start_time + music_position
+
+    def set_vocals_muted(self, muted):
+        if muted != self.vocals_muted:
+            self.vocals_muted = muted
+            self._apply_vocals_volume()
+
+    def _apply_vocals_volume(self):
+        if self.has_vocals():
+            self.vocals_channel.set_volume(0.0 if self.vocals_muted else self.audio_manager.music_volume)
+
+    def _start_vocals(self, position):
+        sound = self.vocals
+        if position > 0:
+            # Saltar dentro de un Sound: un Sound nuevo sobre el resto del
+            # buffer ya decodificado, alineado a frame
+            if self.vocals_raw is None:
+                self.vocals_raw = sound.get_raw()
+            offset = int(position * self.frequency) * self.frame_bytes
+            if offset >= len(self.vocals_raw):
+                self.vocals_channel.stop()
+                return
+            sound = pygame.mixer.Sound(buffer=memoryview(self.vocals_raw)[offset:])
+
+        self.vocals_channel.play(sound)
+        self._apply_vocals_volume()
@@ -0,0 +1,86 @@
+from bisect import bisect_right
+
+STEPS_PER_BEAT = 4
+DEFAULT_SECTION_STEPS = 16
+
+class TimingMap:
+    """Tabla de tiempos del chart, construida una sola vez al cargarlo.
+
+    Guarda por seccion su tiempo y step de inicio acumulados, respetando
+    changeBPM/bpm y lengthInSteps. Pasar de tiempo a beat, step o seccion
+    (y al reves) es una busqueda binaria sobre esas listas, asi que se
+    puede consultar cada frame.
+    """
+
+    def __init__(self, bpm, sections=None):
+        self.base_bpm = bpm
+        self.start_times = []
+        self.start_steps = []
+        self.step_durations = []
+        self.bpms = []
+
+        current_bpm = bpm
+        time = 0.0
+        step = 0.0
+        for section in sections or []:
+            if section.get("changeBPM", False) and section.get("bpm"):
+                current_bpm = section["bpm"]
+
+            length_in_steps = section.get("lengthInSteps", DEFAULT_SECTION_STEPS) or DEFAULT_SECTION_STEPS
+            step_duration = 60.0 / current_bpm / STEPS_PER_BEAT
+
+            self.start_times.append(time)
+            self.start_steps.append(step)
+            self.step_durations.append(step_duration)
+            self.bpms.append(current_bpm)
+
+            time += length_in_steps * step_duration
+            step += length_in_steps
+
+        self.section_count = len(self.start_times)
+        self.end_time = time
+        self.end_step = step
+
+        if not self.start_times:
+            # Sin secciones: un solo tramo con el bpm base
+            self.start_times.append(0.0)
+            self.start_steps.append(0.0)
+            self.step_durations.append(60.0 / bpm / STEPS_PER_BEAT)
+            self.bpms.append(bpm)
+
+    def _segment_at_time(self, time):
+        return max(bisect_right(self.start_times, time) - 1, 0)
+
+    def _segment_at_step(self, step):
+        return max(bisect_right(self.start_steps, step) - 1, 0)
+
+    def time_to_step(self, time):
+        i = self._segment_at_time(time)
+        return self.start_steps[i] + (time - self.start_times[i]) / self.step_durations[i]
+
+    def step_to_time(self, step):
+        i = self._segment_at_step(step)
+        return self.start_times[i] + (step - self.start_steps[i]) * self.step_durations[i]
+
+    def time_to_beat(self, time):
+        return self.time_to_step(time) / STEPS_PER_BEAT
+
+    def beat_to_time(self, beat):
+        return self.step_to_time(beat * STEPS_PER_BEAT)
+
+    def time_to_section(self, time):
+        # Indice de la seccion que suena en 'time', o None fuera del chart
+        if time < 0 or time >= self.end_time:
+            return None
+        return bisect_right(self.start_times, time) - 1
+
+    def section_to_time(self, section_index):
+        if section_index >= self.section_count:
+            return self.end_time
+        return self.start_times[section_index]
+
+    def get_bpm_at_time(self, time):
+        return self.bpms[self._segment_at_time(time)]
+
+    def get_step_duration_at_time(self, time):
+        return self.step_durations[self._segment_at_time(time)]